@@ -60,32 +60,70 @@ from .api.slot_manager import (
     InvalidSlotNumber,
 )
 
-# High-level API classes (from standalone objects)
-from .api import (
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static view of the lazily resolved names below, for type checkers/IDEs
+    from .api import (
+        AudioRecorderSetup,
+        AudioStep,
+        MidiStep,
+        AudioPartTrack,
+        AudioPatternTrack,
+        MidiPartTrack,
+        MidiPatternTrack,
+        AudioSceneTrack,
+        Scene,
+        Part,
+        Pattern,
+        Bank,
+        Project,
+        Settings,
+        RenderSettings,
+        SamplePool,
+    )
+
+# High-level API classes (from standalone objects) are resolved lazily
+# through octapy.api on first access (PEP 562)
+_LAZY = (
     # Leaf objects
-    AudioRecorderSetup,
-    AudioStep,
-    MidiStep,
+    "AudioRecorderSetup",
+    "AudioStep",
+    "MidiStep",
     # Track objects
-    AudioPartTrack,
-    AudioPatternTrack,
-    MidiPartTrack,
-    MidiPatternTrack,
+    "AudioPartTrack",
+    "AudioPatternTrack",
+    "MidiPartTrack",
+    "MidiPatternTrack",
     # Container objects
-    AudioSceneTrack,
-    Scene,
-    Part,
-    Pattern,
+    "AudioSceneTrack",
+    "Scene",
+    "Part",
+    "Pattern",
     # Top-level objects
-    Bank,
-    Project,
+    "Bank",
+    "Project",
     # Settings
-    Settings,
-    RenderSettings,
+    "Settings",
+    "RenderSettings",
     # Utilities
-    SamplePool,
+    "SamplePool",
 )
 
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import api
+    value = getattr(api, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __version__ = "0.1.0"
 
 __all__ = [
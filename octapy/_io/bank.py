@@ -15,8 +15,12 @@ File layout (636113 bytes total):
 - Checksum: 2 bytes (big-endian u16)
 """
 
+import functools
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
 from .base import OTBlock, read_u16_be, write_u16_be
 
@@ -27,11 +31,7 @@ from .base import OTBlock, read_u16_be, write_u16_be
 
 # Bank file
 BANK_FILE_SIZE = 636113
-BANK_HEADER = bytes([
-    0x46, 0x4f, 0x52, 0x4d, 0x00, 0x00, 0x00, 0x00,
-    0x44, 0x50, 0x53, 0x31, 0x42, 0x41, 0x4e, 0x4b,
-    0x00, 0x00, 0x00, 0x00, 0x00
-])  # "FORM....DPS1BANK....."
+BANK_HEADER = b"FORM\x00\x00\x00\x00DPS1BANK\x00\x00\x00\x00\x00"
 BANK_FILE_VERSION = 23
 
 # Pattern and track sizes
@@ -40,9 +40,9 @@ AUDIO_TRACK_SIZE = 0x922        # 2338 bytes per audio track
 MIDI_TRACK_SIZE = 0x4AC         # 1196 bytes per MIDI track
 
 # Headers
-PATTERN_HEADER = bytes([0x50, 0x54, 0x52, 0x4E, 0x00, 0x00, 0x00, 0x00])  # "PTRN...."
-AUDIO_TRACK_HEADER = bytes([0x54, 0x52, 0x41, 0x43])  # "TRAC"
-PART_HEADER = bytes([0x50, 0x41, 0x52, 0x54])  # "PART"
+PATTERN_HEADER = b"PTRN\x00\x00\x00\x00"
+AUDIO_TRACK_HEADER = b"TRAC"
+PART_HEADER = b"PART"
 
 # Part block size
 PART_BLOCK_SIZE = 6331
@@ -65,6 +65,14 @@ class BankOffset(IntEnum):
     CHECKSUM = 0x9B4CF              # 2-byte checksum (big-endian u16)
 
 
+# Plain-int aliases for offsets used on hot paths (skips enum attribute lookup)
+_PATTERNS_OFFSET = int(BankOffset.PATTERNS)
+_PARTS_OFFSET = int(BankOffset.PARTS)
+_SAVED_PARTS_OFFSET = _PARTS_OFFSET + 4 * PART_BLOCK_SIZE
+_FLEX_COUNTER_OFFSET = int(BankOffset.FLEX_COUNTER)
+_CHECKSUM_OFFSET = int(BankOffset.CHECKSUM)
+
+
 class AudioTrackOffset(IntEnum):
     """Offsets within an audio track block (relative to track start)."""
     HEADER = 0                  # 4 bytes: "TRAC"
@@ -822,6 +830,73 @@ class MidiTrackSetupOffset(IntEnum):
     LFO3_TRIG = 35
 
 
+# =============================================================================
+# Checksum Template
+# =============================================================================
+
+def _byte_sum(data, start: int, end: int) -> int:
+    """Sum the bytes of data[start:end] (any buffer: bytearray, bytes, mmap).
+
+    Iterating a bytes object yields cached small ints, which makes the
+    builtin sum over a bytes copy ~1.6x faster than over a memoryview (and
+    an order of magnitude faster than array.array('B')), despite the copy.
+    """
+    return sum(bytes(memoryview(data)[start:end]))
+
+
+def _byte_sum_delta(old: bytes, data, offset: int, chunk: int = 1024) -> int:
+    """Return sum(data[offset:offset + len(old)]) - sum(old).
+
+    The region is compared against its previous contents chunk by chunk
+    (a memcmp each), and only chunks that changed are summed, so a small
+    edit to a large region costs far less than summing it before and after.
+    """
+    delta = 0
+    with memoryview(data) as view:
+        for start in range(0, len(old), chunk):
+            before = old[start:start + chunk]
+            after = view[offset + start:offset + start + len(before)]
+            if after != before:
+                delta += sum(bytes(after)) - sum(before)
+    return delta
+
+
+@functools.lru_cache(maxsize=None)
+def _bank_template():
+    """Return the template's stored checksum and summed bytes (cached).
+
+    The checksum is the template checksum plus the byte-wise difference
+    from the template over [16, CHECKSUM). That difference equals
+    sum(bank) - sum(template), so the template side is summed only once.
+    """
+    from .project import read_template_file
+    data = read_template_file('bank01.work')
+    template_sum = _byte_sum(data, 16, _CHECKSUM_OFFSET)
+    return read_u16_be(data, _CHECKSUM_OFFSET), template_sum
+
+
+# Defaulted bank bytes keyed by the template file's CRC-32. The embedded
+# template's 16 bank files are identical, so this holds a single copy.
+_DEFAULT_BANK_CACHE: Dict[int, bytes] = {}
+
+
+def _default_bank_bytes(bank_num: int) -> bytes:
+    """Return template bank bytes with octapy defaults applied (cached).
+
+    The defaults are applied once per distinct template bank; BankFile.new()
+    then only copies this shared immutable buffer.
+    """
+    from .project import read_template_file, template_file_crc
+    filename = f"bank{bank_num:02d}.work"
+    crc = template_file_crc(filename)
+    data = _DEFAULT_BANK_CACHE.get(crc)
+    if data is None:
+        bank = BankFile.read(read_template_file(filename))
+        bank._apply_octapy_defaults()
+        data = _DEFAULT_BANK_CACHE[crc] = bytes(bank._data)
+    return data
+
+
 # =============================================================================
 # BankFile Class
 # =============================================================================
@@ -844,23 +919,96 @@ class BankFile(OTBlock):
 
     @classmethod
     def read(cls, data) -> "BankFile":
-        """Read bank from binary data."""
+        """Read bank from binary data (any buffer: bytes, bytearray, mmap...)."""
         instance = cls.__new__(cls)
-        instance._data = bytearray(data[:BANK_FILE_SIZE])
+        # Slicing a memoryview is free, so the bytearray is the only copy
+        instance._data = bytearray(memoryview(data)[:BANK_FILE_SIZE])
         return instance
 
     @classmethod
     def from_file(cls, path: Path) -> "BankFile":
         """Load a bank file from disk."""
+        instance = cls.__new__(cls)
+        instance._data = bytearray(BANK_FILE_SIZE)
         with open(path, 'rb') as f:
-            data = f.read()
-        return cls.read(data)
+            n = f.readinto(instance._data)
+        del instance._data[n:]
+        return instance
+
+    @classmethod
+    def load_all(cls, paths: Iterable[Path], max_workers: int = 8) -> List["BankFile"]:
+        """Load several bank files, overlapping their disk reads.
 
-    def to_file(self, path: Path):
-        """Write the bank file to disk."""
-        self.update_checksum()
+        File reads release the GIL, so a small thread pool keeps several
+        reads in flight; results are returned in the order of paths.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(cls.from_file, paths))
+
+    def to_file(self, path: Path, byte_sum: Optional[int] = None):
+        """Write the bank file to disk.
+
+        Args:
+            path: Path to write
+            byte_sum: Precomputed byte_sum() of the checksummed range, for
+                callers that track it incrementally (summed if omitted)
+        """
         with open(path, 'wb') as f:
-            f.write(self._data)
+            self.write_into(f, byte_sum)
+
+    def write_into(self, f, byte_sum: Optional[int] = None):
+        """Update the checksum and write the buffer to a binary file object.
+
+        The buffer is passed as a memoryview, so no intermediate bytes copy
+        is made.
+
+        Args:
+            f: Binary file object to write to
+            byte_sum: Precomputed byte_sum() of the checksummed range, for
+                callers that track it incrementally (summed if omitted)
+        """
+        self.update_checksum(byte_sum)
+        with memoryview(self._data) as view:
+            f.write(view)
+
+    def view(self) -> memoryview:
+        """Zero-copy view of the bank buffer.
+
+        The view aliases the live buffer: while it is held the buffer cannot
+        be resized and an mmap-backed bank cannot be closed. Release it
+        (view.release() or a with block) when done; use write() for an
+        owned bytes copy.
+        """
+        return memoryview(self._data)
+
+    @classmethod
+    def from_file_mmap(cls, path: Path) -> "BankFile":
+        """Map a bank file for in-place editing.
+
+        The buffer is a writable mmap of the file, so pages are loaded on
+        demand and edits write straight through without a full read/write
+        copy. Call flush() to persist (with an updated checksum) and
+        close() to release the mapping.
+        """
+        with open(path, 'r+b') as f:
+            mm = mmap.mmap(f.fileno(), BANK_FILE_SIZE)
+        if hasattr(mmap, 'MADV_WILLNEED'):
+            mm.madvise(mmap.MADV_WILLNEED)
+        instance = cls.__new__(cls)
+        instance._data = mm
+        return instance
+
+    def flush(self):
+        """Update the checksum and flush an mmap-backed bank to disk."""
+        if isinstance(self._data, mmap.mmap):
+            self.update_checksum()
+            self._data.flush()
+
+    def close(self):
+        """Flush and release an mmap-backed bank (no-op for in-memory banks)."""
+        if isinstance(self._data, mmap.mmap):
+            self.flush()
+            self._data.close()
 
     @classmethod
     def new(cls, bank_num: int = 1) -> "BankFile":
@@ -870,12 +1018,7 @@ class BankFile(OTBlock):
         - SRC page: loop_mode=OFF, length_mode=TIME, length=127
         - Recorder: RLEN=16, QREC=PLEN, all sources OFF
         """
-        from .project import read_template_file
-        filename = f"bank{bank_num:02d}.work"
-        data = read_template_file(filename)
-        bank = cls.read(data)
-        bank._apply_octapy_defaults()
-        return bank
+        return cls.read(_default_bank_bytes(bank_num))
 
     def _apply_octapy_defaults(self) -> None:
         """Apply all octapy default overrides to the bank.
@@ -895,8 +1038,8 @@ class BankFile(OTBlock):
         - SRC VALUES: length = 127 (was 0)
         - SRC SETUP: loop_mode = OFF (was ON), length_mode = TIME (was OFF)
         """
-        for part_num in range(1, 5):
-            part_offset = self.part_offset(part_num)
+        # Both the unsaved and saved copies of each Part, so they stay identical
+        for part_offset in self._all_part_offsets():
             for track_idx in range(8):
                 values_base = part_offset + PartOffset.AUDIO_TRACK_MACHINE_PARAMS_VALUES
                 setup_base = part_offset + PartOffset.AUDIO_TRACK_MACHINE_PARAMS_SETUP
@@ -918,8 +1061,7 @@ class BankFile(OTBlock):
         - loop = OFF (was ON)
         - qrec = PLEN (was OFF)
         """
-        for part_num in range(1, 5):
-            part_offset = self.part_offset(part_num)
+        for part_offset in self._all_part_offsets():
             for track_idx in range(8):
                 recorder_offset = part_offset + PartOffset.RECORDER_SETUP + track_idx * RECORDER_SETUP_SIZE
                 self._data[recorder_offset:recorder_offset + RECORDER_SETUP_SIZE] = OCTAPY_DEFAULT_RECORDER_SETUP
@@ -935,7 +1077,10 @@ class BankFile(OTBlock):
         return self._data[BankOffset.VERSION]
 
     def check_header(self) -> bool:
-        return self.header == BANK_HEADER
+        data = self._data
+        if isinstance(data, mmap.mmap):
+            return data.find(BANK_HEADER, 0, len(BANK_HEADER)) == 0
+        return data.startswith(BANK_HEADER)
 
     def check_version(self) -> bool:
         return self.version == BANK_FILE_VERSION
@@ -944,7 +1089,7 @@ class BankFile(OTBlock):
 
     def pattern_offset(self, pattern: int) -> int:
         """Get byte offset for pattern (1-16)."""
-        return BankOffset.PATTERNS + (pattern - 1) * PATTERN_SIZE
+        return _PATTERNS_OFFSET + (pattern - 1) * PATTERN_SIZE
 
     def audio_track_offset(self, pattern: int, track: int) -> int:
         """Get byte offset for audio track (pattern 1-16, track 1-8)."""
@@ -953,20 +1098,26 @@ class BankFile(OTBlock):
 
     def part_offset(self, part: int, saved: bool = False) -> int:
         """Get byte offset for part (1-4)."""
-        base = BankOffset.PARTS
-        if saved:
-            base += 4 * PART_BLOCK_SIZE
+        base = _SAVED_PARTS_OFFSET if saved else _PARTS_OFFSET
         return base + (part - 1) * PART_BLOCK_SIZE
 
+    def _all_part_offsets(self) -> List[int]:
+        """Byte offsets of every Part block, unsaved (1-4) then saved (1-4)."""
+        return [
+            self.part_offset(part, saved)
+            for saved in (False, True)
+            for part in range(1, 5)
+        ]
+
     # === Flex counter ===
 
     @property
     def flex_count(self) -> int:
-        return self._data[BankOffset.FLEX_COUNTER]
+        return self._data[_FLEX_COUNTER_OFFSET]
 
     @flex_count.setter
     def flex_count(self, value: int):
-        self._data[BankOffset.FLEX_COUNTER] = value & 0xFF
+        self._data[_FLEX_COUNTER_OFFSET] = value & 0xFF
 
     # === Trig helpers (for testing) ===
 
@@ -1050,23 +1201,32 @@ class BankFile(OTBlock):
 
     # === Checksum ===
 
-    def calculate_checksum(self) -> int:
-        """Calculate checksum for bank file."""
-        from .project import read_template_file
-        template = read_template_file('bank01.work')
-        template_checksum = read_u16_be(template, BankOffset.CHECKSUM)
+    def byte_sum(self, start: int = 16, end: int = _CHECKSUM_OFFSET) -> int:
+        """Sum of the buffer bytes in [start, end) (default: checksummed range)."""
+        return _byte_sum(self._data, start, end)
 
-        byte_diffs = 0
-        for i in range(16, BankOffset.CHECKSUM):
-            byte_diffs += self._data[i] - template[i]
+    def byte_sum_delta(self, old: bytes, offset: int) -> int:
+        """Change in byte sum of the region at offset since it held old."""
+        return _byte_sum_delta(old, self._data, offset)
+
+    def calculate_checksum(self, byte_sum: Optional[int] = None) -> int:
+        """Calculate checksum for bank file.
+
+        Args:
+            byte_sum: Precomputed byte_sum() of the checksummed range, for
+                callers that track it incrementally (summed if omitted)
+        """
+        template_checksum, template_sum = _bank_template()
+        if byte_sum is None:
+            byte_sum = self.byte_sum()
 
-        return (template_checksum + byte_diffs) & 0xFFFF
+        return (template_checksum + byte_sum - template_sum) & 0xFFFF
 
-    def update_checksum(self):
+    def update_checksum(self, byte_sum: Optional[int] = None):
         """Recalculate and update the checksum."""
-        write_u16_be(self._data, BankOffset.CHECKSUM, self.calculate_checksum())
+        write_u16_be(self._data, _CHECKSUM_OFFSET, self.calculate_checksum(byte_sum))
 
     def verify_checksum(self) -> bool:
         """Verify the checksum matches the calculated value."""
-        stored = read_u16_be(self._data, BankOffset.CHECKSUM)
+        stored = read_u16_be(self._data, _CHECKSUM_OFFSET)
         return stored == self.calculate_checksum()
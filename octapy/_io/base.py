@@ -7,45 +7,43 @@ Follows pym8-style pattern:
 - read()/write() methods for serialization
 """
 
+import struct
+
+
+# Precompiled formats: one C call per multi-byte field
+_U16_LE = struct.Struct('<H')
+_U16_BE = struct.Struct('>H')
+_U32_BE = struct.Struct('>I')
+
 
 def read_u16_le(data, offset):
     """Read little-endian uint16."""
-    return data[offset] | (data[offset + 1] << 8)
+    return _U16_LE.unpack_from(data, offset)[0]
 
 
 def write_u16_le(data, offset, value):
     """Write little-endian uint16."""
-    data[offset] = value & 0xFF
-    data[offset + 1] = (value >> 8) & 0xFF
+    _U16_LE.pack_into(data, offset, value & 0xFFFF)
 
 
 def read_u16_be(data, offset):
     """Read big-endian uint16."""
-    return (data[offset] << 8) | data[offset + 1]
+    return _U16_BE.unpack_from(data, offset)[0]
 
 
 def write_u16_be(data, offset, value):
     """Write big-endian uint16."""
-    data[offset] = (value >> 8) & 0xFF
-    data[offset + 1] = value & 0xFF
+    _U16_BE.pack_into(data, offset, value & 0xFFFF)
 
 
 def read_u32_be(data, offset):
     """Read big-endian uint32."""
-    return (
-        (data[offset] << 24) |
-        (data[offset + 1] << 16) |
-        (data[offset + 2] << 8) |
-        data[offset + 3]
-    )
+    return _U32_BE.unpack_from(data, offset)[0]
 
 
 def write_u32_be(data, offset, value):
     """Write big-endian uint32."""
-    data[offset] = (value >> 24) & 0xFF
-    data[offset + 1] = (value >> 16) & 0xFF
-    data[offset + 2] = (value >> 8) & 0xFF
-    data[offset + 3] = value & 0xFF
+    _U32_BE.pack_into(data, offset, value & 0xFFFFFFFF)
 
 
 class OTBlock:
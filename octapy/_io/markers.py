@@ -34,11 +34,7 @@ from .base import OTBlock, read_u32_be, write_u32_be, read_u16_be, write_u16_be
 # Constants
 # =============================================================================
 
-MARKERS_HEADER = bytes([
-    0x46, 0x4f, 0x52, 0x4d, 0x00, 0x00, 0x00, 0x00,
-    0x44, 0x50, 0x53, 0x31, 0x53, 0x41, 0x4d, 0x50,
-    0x00, 0x00, 0x00, 0x00, 0x00
-])  # "FORM....DPS1SAMP....."
+MARKERS_HEADER = b"FORM\x00\x00\x00\x00DPS1SAMP\x00\x00\x00\x00\x00"
 MARKERS_FILE_VERSION = 4
 
 NUM_FLEX_SLOTS = 136      # 128 sample + 8 recorder
@@ -499,7 +495,7 @@ class MarkersFile(OTBlock):
         return self._data[MarkersOffset.VERSION]
 
     def check_header(self) -> bool:
-        return self.header == MARKERS_HEADER
+        return self._data.startswith(MARKERS_HEADER)
 
     def check_version(self) -> bool:
         return self.version == MARKERS_FILE_VERSION
@@ -7,22 +7,224 @@ The project file (project.work) is a text-based INI-style file containing:
 - Project state (current bank, pattern, etc.)
 - Sample slot assignments
 
-IMPORTANT: project.work uses CRLF line endings (\\r\\n), not LF.
+IMPORTANT: project.work uses CRLF line endings (\\r\\n), not LF. The
+output templates carry CRLF already, so files are written in binary mode
+with no newline translation at write time.
 """
 
 from __future__ import annotations
 
-import re
+import functools
+import io
+import mmap
+import os
+import shutil
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import zipfile
+
+
+# =============================================================================
+# Parser Tables
+# =============================================================================
+
+def _decode(value: bytes) -> str:
+    """Decode a captured field value."""
+    return value.decode('utf-8').strip()
+
+
+# Per-section KEY -> (attribute, converter) dispatch for the line parser.
+# Keys not listed here are skipped.
+_META_FIELDS = {
+    b'VERSION': ('version', int),
+    b'OS_VERSION': ('os_version', _decode),
+}
+
+_SETTINGS_FIELDS = {
+    b'TEMPOx24': ('tempo_x24', int),
+    b'PATTERN_TEMPO_ENABLED': ('pattern_tempo_enabled', int),
+    b'MIDI_CLOCK_SEND': ('midi_clock_send', int),
+    b'MIDI_CLOCK_RECEIVE': ('midi_clock_receive', int),
+    b'MIDI_TRANSPORT_SEND': ('midi_transport_send', int),
+    b'MIDI_TRANSPORT_RECEIVE': ('midi_transport_receive', int),
+    b'MIDI_PROGRAM_CHANGE_SEND': ('midi_program_change_send', int),
+    b'MIDI_PROGRAM_CHANGE_SEND_CH': ('midi_program_change_send_ch', int),
+    b'MIDI_PROGRAM_CHANGE_RECEIVE': ('midi_program_change_receive', int),
+    b'MIDI_PROGRAM_CHANGE_RECEIVE_CH': ('midi_program_change_receive_ch', int),
+    b'MASTER_TRACK': ('master_track', int),
+}
+
+_SAMPLE_FIELDS = {
+    b'TYPE': ('slot_type', _decode),
+    b'SLOT': ('slot_number', int),
+    b'PATH': ('path', _decode),
+    b'GAIN': ('gain', int),
+}
+
+# ProjectFile field -> section holding it, for selective parsing
+_SECTION_FOR_FIELD = {
+    'version': b'META',
+    'os_version': b'META',
+    'settings': b'SETTINGS',
+    'sample_slots': b'SAMPLE',
+}
+
+
+# =============================================================================
+# Output Templates
+# =============================================================================
+
+# Sections of project.work, filled in with str.format; constant sections
+# are pre-encoded bytes. Lines that octapy does not model are baked in with
+# the OT defaults. Templates are written with LF for readability and
+# converted to CRLF once at import, so generated content never needs a
+# line-ending pass.
+
+# O_BINARY stops Windows from translating line endings on raw descriptors
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _crlf(text: str) -> str:
+    """Convert LF line endings to the CRLF used by project.work."""
+    return text.replace('\n', '\r\n')
+
+
+_HEADER = _crlf("""\
+############################
+# Project Settings
+############################
+
+""").encode('utf-8')
+
+_META_TEMPLATE = _crlf("""\
+[META]
+TYPE=OCTATRACK DPS-1 PROJECT
+VERSION={version}
+OS_VERSION={os_version}
+[/META]
+
+""")
+
+_MIDI_TRIG_CHANNELS = ''.join(f"MIDI_TRIG_CH{i + 1}={i}\n" for i in range(8))
+
+_TRIG_MODE_MIDI = "TRIG_MODE_MIDI=0\n" * 8
+
+_SETTINGS_TEMPLATE = _crlf("""\
+[SETTINGS]
+WRITEPROTECTED={s.write_protected}
+TEMPOx24={s.tempo_x24}
+PATTERN_TEMPO_ENABLED={s.pattern_tempo_enabled}
+MIDI_CLOCK_SEND={s.midi_clock_send}
+MIDI_CLOCK_RECEIVE={s.midi_clock_receive}
+MIDI_TRANSPORT_SEND={s.midi_transport_send}
+MIDI_TRANSPORT_RECEIVE={s.midi_transport_receive}
+MIDI_PROGRAM_CHANGE_SEND={s.midi_program_change_send}
+MIDI_PROGRAM_CHANGE_SEND_CH={s.midi_program_change_send_ch}
+MIDI_PROGRAM_CHANGE_RECEIVE={s.midi_program_change_receive}
+MIDI_PROGRAM_CHANGE_RECEIVE_CH={s.midi_program_change_receive_ch}
+""" + _MIDI_TRIG_CHANNELS + """\
+MIDI_AUTO_CHANNEL=10
+MIDI_SOFT_THRU=0
+MIDI_AUDIO_TRK_CC_IN=1
+MIDI_AUDIO_TRK_CC_OUT=3
+MIDI_AUDIO_TRK_NOTE_IN=1
+MIDI_AUDIO_TRK_NOTE_OUT=3
+MIDI_MIDI_TRK_CC_IN=1
+PATTERN_CHANGE_CHAIN_BEHAVIOR=0
+PATTERN_CHANGE_AUTO_SILENCE_TRACKS=0
+PATTERN_CHANGE_AUTO_TRIG_LFOS=0
+LOAD_24BIT_FLEX={s.load_24bit_flex}
+DYNAMIC_RECORDERS={s.dynamic_recorders}
+RECORD_24BIT={s.record_24bit}
+RESERVED_RECORDER_COUNT={s.reserved_recorder_count}
+RESERVED_RECORDER_LENGTH={s.reserved_recorder_length}
+INPUT_DELAY_COMPENSATION=0
+GATE_AB=127
+GATE_CD=127
+GAIN_AB=64
+GAIN_CD=64
+DIR_AB=0
+DIR_CD=0
+PHONES_MIX=64
+MAIN_TO_CUE=0
+MASTER_TRACK={s.master_track}
+CUE_STUDIO_MODE=0
+MAIN_LEVEL=64
+CUE_LEVEL=64
+METRONOME_TIME_SIGNATURE=3
+METRONOME_TIME_SIGNATURE_DENOMINATOR=2
+METRONOME_PREROLL=0
+METRONOME_CUE_VOLUME=32
+METRONOME_MAIN_VOLUME=0
+METRONOME_PITCH=12
+METRONOME_TONAL=1
+METRONOME_ENABLED=0
+""" + _TRIG_MODE_MIDI + """\
+[/SETTINGS]
+
+""")
+
+_STATES_TEMPLATE = _crlf("""\
+############################
+# Project States
+############################
+
+[STATES]
+BANK={s.bank}
+PATTERN={s.pattern}
+ARRANGEMENT={s.arrangement}
+ARRANGEMENT_MODE={s.arrangement_mode}
+PART={s.part}
+TRACK={s.track}
+TRACK_OTHERMODE={s.track_othermode}
+SCENE_A_MUTE={s.scene_a_mute}
+SCENE_B_MUTE={s.scene_b_mute}
+TRACK_CUE_MASK={s.track_cue_mask}
+TRACK_MUTE_MASK={s.track_mute_mask}
+TRACK_SOLO_MASK={s.track_solo_mask}
+MIDI_TRACK_MUTE_MASK={s.midi_track_mute_mask}
+MIDI_TRACK_SOLO_MASK={s.midi_track_solo_mask}
+MIDI_MODE={s.midi_mode}
+[/STATES]
+
+""")
+
+_SAMPLES_HEADER = _crlf("""\
+############################
+# Samples
+############################
+
+""").encode('utf-8')
+
+_FOOTER = b"############################\r\n"
+
+_SAMPLE_TEMPLATE = _crlf("""\
+[SAMPLE]
+TYPE=%s
+SLOT=%03d
+PATH=%s
+BPMx24=%d
+TSMODE=%d
+LOOPMODE=%d
+GAIN=%d
+TRIGQUANTIZATION=%d
+[/SAMPLE]
+""")
 
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__; dataclass(slots=True)
+# is only available from Python 3.10, older interpreters get plain classes.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class SampleSlot:
     """
     A sample slot assignment in the project.
@@ -40,21 +242,20 @@ class SampleSlot:
     trig_quantization: int = -1 # -1 = default
 
     def to_ini_block(self) -> str:
-        """Convert to INI block format."""
-        return f"""[SAMPLE]
-TYPE={self.slot_type}
-SLOT={self.slot_number:03d}
-PATH={self.path}
-BPMx24={self.bpm_x24}
-TSMODE={self.timestretch_mode}
-LOOPMODE={self.loop_mode}
-GAIN={self.gain}
-TRIGQUANTIZATION={self.trig_quantization}
-[/SAMPLE]
-"""
+        """Convert to INI block format (CRLF line endings)."""
+        return _SAMPLE_TEMPLATE % (
+            self.slot_type,
+            self.slot_number,
+            self.path,
+            self.bpm_x24,
+            self.timestretch_mode,
+            self.loop_mode,
+            self.gain,
+            self.trig_quantization,
+        )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProjectSettings:
     """Project-level settings."""
     write_protected: int = 0
@@ -76,7 +277,7 @@ class ProjectSettings:
     master_track: int = 0           # 0 = disabled, 1 = track 8 is master
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProjectState:
     """Current project state (bank, pattern, track, etc.)."""
     bank: int = 0
@@ -100,7 +301,7 @@ class ProjectState:
 # ProjectFile Class
 # =============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProjectFile:
     """
     Low-level Octatrack project file I/O (project.work).
@@ -111,238 +312,141 @@ class ProjectFile:
     version: int = 19
     settings: ProjectSettings = field(default_factory=ProjectSettings)
     state: ProjectState = field(default_factory=ProjectState)
-    sample_slots: List[SampleSlot] = field(default_factory=list)
+    sample_slots: List[SampleSlot] = field(default_factory=list)  # Ordered by slot_number
 
     @classmethod
-    def from_file(cls, path: Path) -> "ProjectFile":
-        """Load a project file from disk."""
-        with open(path, 'rb') as f:
-            content = f.read().decode('utf-8')
-
+    def from_file(cls, path: Path, fields: Optional[Iterable[str]] = None) -> "ProjectFile":
+        """Load a project file from disk.
+
+        Args:
+            path: Path to project.work
+            fields: Optional subset of "version", "os_version", "settings"
+                and "sample_slots" to parse. Other sections are skipped and
+                reading stops once the requested sections are done, so a
+                tempo lookup never walks the sample list. None parses all.
+        """
         project = cls()
-        project._parse_content(content)
+        with open(path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped; there is nothing to parse
+                return project
+            try:
+                project._parse_lines(iter(mm.readline, b''), fields)
+            finally:
+                mm.close()
         return project
 
     @classmethod
     def new(cls) -> "ProjectFile":
-        """Create a new ProjectFile from the embedded template."""
-        data = read_template_file("project.work")
-        content = data.decode('utf-8')
+        """Create a new ProjectFile matching the embedded template.
+
+        The dataclass defaults already mirror the template's project.work,
+        so the template is not read or parsed; only the 8 recorder buffer
+        slots it contains are added.
+        """
         project = cls()
-        project._parse_content(content)
+        project.add_recorder_slots()
         return project
 
-    def _parse_content(self, content: str) -> None:
+    def _parse_content(self, content: str, fields: Optional[Iterable[str]] = None) -> None:
         """Parse the INI-style content."""
-        content = content.replace('\r\n', '\n')
-
-        # Parse META section
-        meta_match = re.search(r'\[META\](.*?)\[/META\]', content, re.DOTALL)
-        if meta_match:
-            meta_content = meta_match.group(1)
-            version_match = re.search(r'VERSION=(\d+)', meta_content)
-            if version_match:
-                self.version = int(version_match.group(1))
-            os_match = re.search(r'OS_VERSION=(.+)', meta_content)
-            if os_match:
-                self.os_version = os_match.group(1).strip()
-
-        # Parse SETTINGS section
-        settings_match = re.search(r'\[SETTINGS\](.*?)\[/SETTINGS\]', content, re.DOTALL)
-        if settings_match:
-            settings_content = settings_match.group(1)
-
-            tempo_match = re.search(r'TEMPOx24=(\d+)', settings_content)
-            if tempo_match:
-                self.settings.tempo_x24 = int(tempo_match.group(1))
-
-            pattern_tempo_match = re.search(r'PATTERN_TEMPO_ENABLED=(\d+)', settings_content)
-            if pattern_tempo_match:
-                self.settings.pattern_tempo_enabled = int(pattern_tempo_match.group(1))
-
-            # Parse MIDI settings
-            midi_clock_send = re.search(r'MIDI_CLOCK_SEND=(\d+)', settings_content)
-            if midi_clock_send:
-                self.settings.midi_clock_send = int(midi_clock_send.group(1))
-
-            midi_clock_receive = re.search(r'MIDI_CLOCK_RECEIVE=(\d+)', settings_content)
-            if midi_clock_receive:
-                self.settings.midi_clock_receive = int(midi_clock_receive.group(1))
-
-            midi_transport_send = re.search(r'MIDI_TRANSPORT_SEND=(\d+)', settings_content)
-            if midi_transport_send:
-                self.settings.midi_transport_send = int(midi_transport_send.group(1))
-
-            midi_transport_receive = re.search(r'MIDI_TRANSPORT_RECEIVE=(\d+)', settings_content)
-            if midi_transport_receive:
-                self.settings.midi_transport_receive = int(midi_transport_receive.group(1))
-
-            midi_pc_send = re.search(r'MIDI_PROGRAM_CHANGE_SEND=(\d+)', settings_content)
-            if midi_pc_send:
-                self.settings.midi_program_change_send = int(midi_pc_send.group(1))
-
-            midi_pc_send_ch = re.search(r'MIDI_PROGRAM_CHANGE_SEND_CH=(-?\d+)', settings_content)
-            if midi_pc_send_ch:
-                self.settings.midi_program_change_send_ch = int(midi_pc_send_ch.group(1))
-
-            midi_pc_receive = re.search(r'MIDI_PROGRAM_CHANGE_RECEIVE=(\d+)', settings_content)
-            if midi_pc_receive:
-                self.settings.midi_program_change_receive = int(midi_pc_receive.group(1))
-
-            midi_pc_receive_ch = re.search(r'MIDI_PROGRAM_CHANGE_RECEIVE_CH=(-?\d+)', settings_content)
-            if midi_pc_receive_ch:
-                self.settings.midi_program_change_receive_ch = int(midi_pc_receive_ch.group(1))
-
-            master_track = re.search(r'MASTER_TRACK=(\d+)', settings_content)
-            if master_track:
-                self.settings.master_track = int(master_track.group(1))
-
-        # Parse SAMPLE sections
-        sample_matches = re.findall(r'\[SAMPLE\](.*?)\[/SAMPLE\]', content, re.DOTALL)
-        for sample_content in sample_matches:
-            slot = SampleSlot()
-
-            type_match = re.search(r'TYPE=(\w+)', sample_content)
-            if type_match:
-                slot.slot_type = type_match.group(1)
-
-            slot_match = re.search(r'SLOT=(\d+)', sample_content)
-            if slot_match:
-                slot.slot_number = int(slot_match.group(1))
-
-            path_match = re.search(r'PATH=(.+)', sample_content)
-            if path_match:
-                slot.path = path_match.group(1).strip()
-
-            gain_match = re.search(r'GAIN=(\d+)', sample_content)
-            if gain_match:
-                slot.gain = int(gain_match.group(1))
-
-            self.sample_slots.append(slot)
+        self._parse_lines(content.encode('utf-8').splitlines(), fields)
+
+    def _parse_lines(self, lines, fields: Optional[Iterable[str]] = None) -> None:
+        """
+        Parse the INI-style content from an iterable of byte lines.
+
+        Single pass: section markers switch the active dispatch table and
+        KEY=VALUE lines are routed to the matching attribute. Lines may
+        keep their CRLF or LF terminator. With a fields whitelist, other
+        sections are skipped and parsing stops once the wanted sections
+        have closed.
+        """
+        wanted = None
+        if fields is not None:
+            unknown = set(fields) - _SECTION_FOR_FIELD.keys()
+            if unknown:
+                raise ValueError(f"Unknown project fields: {sorted(unknown)}")
+            wanted = {_SECTION_FOR_FIELD[name] for name in fields}
+            if not wanted:
+                return
+
+        table = None
+        target = None
+        slot = None
+
+        for line in lines:
+            line = line.rstrip(b'\r\n')
+            if line.startswith(b'['):
+                if line.startswith(b'[/'):
+                    section = line[2:-1]
+                    if slot is not None:
+                        self._insert_slot(slot)
+                        slot = None
+                    table = target = None
+                    # Samples run to the end of the file, so only META and
+                    # SETTINGS can complete the whitelist early
+                    if wanted is not None and section != b'SAMPLE':
+                        wanted.discard(section)
+                        if not wanted:
+                            return
+                    continue
+
+                section = line[1:-1]
+                if wanted is not None and section not in wanted:
+                    table = target = None
+                elif section == b'SAMPLE':
+                    slot = SampleSlot()
+                    table, target = _SAMPLE_FIELDS, slot
+                elif section == b'META':
+                    table, target = _META_FIELDS, self
+                elif section == b'SETTINGS':
+                    table, target = _SETTINGS_FIELDS, self.settings
+                else:
+                    table = target = None
+                continue
+
+            if table is None:
+                continue
+            key, sep, value = line.partition(b'=')
+            if sep:
+                entry = table.get(key)
+                if entry is not None:
+                    attr, convert = entry
+                    setattr(target, attr, convert(value))
 
     def to_file(self, path: Path) -> None:
-        """Write the project file to disk with CRLF line endings."""
-        content = self._generate_content()
-        content_crlf = content.replace('\n', '\r\n')
-
-        with open(path, 'wb') as f:
-            f.write(content_crlf.encode('utf-8'))
+        """Write the project file to disk with CRLF line endings.
+
+        project.work is small, so the encoded sections are joined once and
+        written with os.write on a raw descriptor, skipping the buffered
+        file object layer.
+        """
+        data = memoryview(b''.join(self._iter_chunks()))
+        fd = os.open(path, _WRITE_FLAGS, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        """Yield the encoded project.work content one section at a time."""
+        yield _HEADER
+        yield _META_TEMPLATE.format(
+            version=self.version, os_version=self.os_version).encode('utf-8')
+        yield _SETTINGS_TEMPLATE.format(s=self.settings).encode('utf-8')
+        yield _STATES_TEMPLATE.format(s=self.state).encode('utf-8')
+        yield _SAMPLES_HEADER
+        for slot in self.sample_slots:
+            yield (slot.to_ini_block() + '\r\n').encode('utf-8')
+        yield _FOOTER
 
     def _generate_content(self) -> str:
-        """Generate the INI-style content."""
-        lines = []
-
-        # Header comment
-        lines.append("############################")
-        lines.append("# Project Settings")
-        lines.append("############################")
-        lines.append("")
-
-        # META section
-        lines.append("[META]")
-        lines.append("TYPE=OCTATRACK DPS-1 PROJECT")
-        lines.append(f"VERSION={self.version}")
-        lines.append(f"OS_VERSION={self.os_version}")
-        lines.append("[/META]")
-        lines.append("")
-
-        # SETTINGS section
-        lines.append("[SETTINGS]")
-        lines.append(f"WRITEPROTECTED={self.settings.write_protected}")
-        lines.append(f"TEMPOx24={self.settings.tempo_x24}")
-        lines.append(f"PATTERN_TEMPO_ENABLED={self.settings.pattern_tempo_enabled}")
-        lines.append(f"MIDI_CLOCK_SEND={self.settings.midi_clock_send}")
-        lines.append(f"MIDI_CLOCK_RECEIVE={self.settings.midi_clock_receive}")
-        lines.append(f"MIDI_TRANSPORT_SEND={self.settings.midi_transport_send}")
-        lines.append(f"MIDI_TRANSPORT_RECEIVE={self.settings.midi_transport_receive}")
-        lines.append(f"MIDI_PROGRAM_CHANGE_SEND={self.settings.midi_program_change_send}")
-        lines.append(f"MIDI_PROGRAM_CHANGE_SEND_CH={self.settings.midi_program_change_send_ch}")
-        lines.append(f"MIDI_PROGRAM_CHANGE_RECEIVE={self.settings.midi_program_change_receive}")
-        lines.append(f"MIDI_PROGRAM_CHANGE_RECEIVE_CH={self.settings.midi_program_change_receive_ch}")
-
-        for i in range(8):
-            lines.append(f"MIDI_TRIG_CH{i+1}={i}")
-
-        lines.append("MIDI_AUTO_CHANNEL=10")
-        lines.append("MIDI_SOFT_THRU=0")
-        lines.append("MIDI_AUDIO_TRK_CC_IN=1")
-        lines.append("MIDI_AUDIO_TRK_CC_OUT=3")
-        lines.append("MIDI_AUDIO_TRK_NOTE_IN=1")
-        lines.append("MIDI_AUDIO_TRK_NOTE_OUT=3")
-        lines.append("MIDI_MIDI_TRK_CC_IN=1")
-        lines.append("PATTERN_CHANGE_CHAIN_BEHAVIOR=0")
-        lines.append("PATTERN_CHANGE_AUTO_SILENCE_TRACKS=0")
-        lines.append("PATTERN_CHANGE_AUTO_TRIG_LFOS=0")
-        lines.append(f"LOAD_24BIT_FLEX={self.settings.load_24bit_flex}")
-        lines.append(f"DYNAMIC_RECORDERS={self.settings.dynamic_recorders}")
-        lines.append(f"RECORD_24BIT={self.settings.record_24bit}")
-        lines.append(f"RESERVED_RECORDER_COUNT={self.settings.reserved_recorder_count}")
-        lines.append(f"RESERVED_RECORDER_LENGTH={self.settings.reserved_recorder_length}")
-        lines.append("INPUT_DELAY_COMPENSATION=0")
-        lines.append("GATE_AB=127")
-        lines.append("GATE_CD=127")
-        lines.append("GAIN_AB=64")
-        lines.append("GAIN_CD=64")
-        lines.append("DIR_AB=0")
-        lines.append("DIR_CD=0")
-        lines.append("PHONES_MIX=64")
-        lines.append("MAIN_TO_CUE=0")
-        lines.append(f"MASTER_TRACK={self.settings.master_track}")
-        lines.append("CUE_STUDIO_MODE=0")
-        lines.append("MAIN_LEVEL=64")
-        lines.append("CUE_LEVEL=64")
-        lines.append("METRONOME_TIME_SIGNATURE=3")
-        lines.append("METRONOME_TIME_SIGNATURE_DENOMINATOR=2")
-        lines.append("METRONOME_PREROLL=0")
-        lines.append("METRONOME_CUE_VOLUME=32")
-        lines.append("METRONOME_MAIN_VOLUME=0")
-        lines.append("METRONOME_PITCH=12")
-        lines.append("METRONOME_TONAL=1")
-        lines.append("METRONOME_ENABLED=0")
-
-        for _ in range(8):
-            lines.append("TRIG_MODE_MIDI=0")
-
-        lines.append("[/SETTINGS]")
-        lines.append("")
-
-        # STATES section
-        lines.append("############################")
-        lines.append("# Project States")
-        lines.append("############################")
-        lines.append("")
-        lines.append("[STATES]")
-        lines.append(f"BANK={self.state.bank}")
-        lines.append(f"PATTERN={self.state.pattern}")
-        lines.append(f"ARRANGEMENT={self.state.arrangement}")
-        lines.append(f"ARRANGEMENT_MODE={self.state.arrangement_mode}")
-        lines.append(f"PART={self.state.part}")
-        lines.append(f"TRACK={self.state.track}")
-        lines.append(f"TRACK_OTHERMODE={self.state.track_othermode}")
-        lines.append(f"SCENE_A_MUTE={self.state.scene_a_mute}")
-        lines.append(f"SCENE_B_MUTE={self.state.scene_b_mute}")
-        lines.append(f"TRACK_CUE_MASK={self.state.track_cue_mask}")
-        lines.append(f"TRACK_MUTE_MASK={self.state.track_mute_mask}")
-        lines.append(f"TRACK_SOLO_MASK={self.state.track_solo_mask}")
-        lines.append(f"MIDI_TRACK_MUTE_MASK={self.state.midi_track_mute_mask}")
-        lines.append(f"MIDI_TRACK_SOLO_MASK={self.state.midi_track_solo_mask}")
-        lines.append(f"MIDI_MODE={self.state.midi_mode}")
-        lines.append("[/STATES]")
-        lines.append("")
-
-        # SAMPLES section
-        lines.append("############################")
-        lines.append("# Samples")
-        lines.append("############################")
-        lines.append("")
-
-        for slot in sorted(self.sample_slots, key=lambda s: s.slot_number):
-            lines.append(slot.to_ini_block())
-
-        lines.append("############################")
-        lines.append("")
-
-        return '\n'.join(lines)
+        """Generate the INI-style content with CRLF line endings."""
+        return b''.join(self._iter_chunks()).decode('utf-8')
 
     def add_sample_slot(
         self,
@@ -362,7 +466,7 @@ class ProjectFile:
             loop_mode=loop_mode,
             timestretch_mode=timestretch_mode,
         )
-        self.sample_slots.append(slot)
+        self._insert_slot(slot)
         return slot
 
     def add_recorder_slots(self) -> None:
@@ -378,7 +482,20 @@ class ProjectFile:
                 gain=72,
                 trig_quantization=-1,
             )
-            self.sample_slots.append(slot)
+            self._insert_slot(slot)
+
+    def _insert_slot(self, slot: SampleSlot) -> None:
+        """
+        Insert a slot keeping sample_slots ordered by slot number.
+
+        Slots are usually added in ascending order, so the scan from the
+        end is O(1) in the common case and serialization never has to sort.
+        """
+        slots = self.sample_slots
+        i = len(slots)
+        while i and slots[i - 1].slot_number > slot.slot_number:
+            i -= 1
+        slots.insert(i, slot)
 
     @property
     def tempo(self) -> float:
@@ -405,6 +522,9 @@ class ProjectFile:
 # Project zip/unzip utilities
 # =============================================================================
 
+_COPY_BUFFER_SIZE = 1 << 20
+
+
 def zip_project(project_dir: Path, zip_path: Path, audio_subdir: str = "projects") -> None:
     """Zip a project directory into a single archive.
 
@@ -412,8 +532,8 @@ def zip_project(project_dir: Path, zip_path: Path, audio_subdir: str = "projects
     so the archive extracts directly to a named project folder.
 
     Structure:
-        {project_name}/                          - .work files
-        AUDIO/{audio_subdir}/{project_name}/     - .wav files
+        {project_name}/                          - .work files (deflated)
+        AUDIO/{audio_subdir}/{project_name}/     - .wav files (stored)
 
     The audio_subdir must match the subdir used when adding samples
     (Project._audio_subdir), so that paths in project.work resolve
@@ -423,16 +543,22 @@ def zip_project(project_dir: Path, zip_path: Path, audio_subdir: str = "projects
 
     project_name = project_dir.name
 
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for file_path in project_dir.iterdir():
-            if file_path.is_file() and file_path.suffix == '.work':
-                zf.write(file_path, f"{project_name}/{file_path.name}")
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        for file_path in project_dir.glob("*.work"):
+            zf.write(file_path, f"{project_name}/{file_path.name}",
+                     compress_type=zipfile.ZIP_DEFLATED, compresslevel=6)
 
-        # Include samples/ directory if present
+        # Include samples/ directory if present. PCM audio barely deflates,
+        # so samples are stored uncompressed and copied straight into the
+        # entry stream with a large buffer (CRC is computed as it streams).
         samples_dir = project_dir / "samples"
         if samples_dir.exists():
             for sample_file in samples_dir.glob("*.wav"):
-                zf.write(sample_file, f"AUDIO/{audio_subdir}/{project_name}/{sample_file.name}")
+                info = zipfile.ZipInfo.from_file(
+                    sample_file, f"AUDIO/{audio_subdir}/{project_name}/{sample_file.name}")
+                info.compress_type = zipfile.ZIP_STORED
+                with open(sample_file, 'rb') as src, zf.open(info, 'w') as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
 
 
 def unzip_project(zip_path: Path, dest_dir: Path) -> None:
@@ -440,8 +566,19 @@ def unzip_project(zip_path: Path, dest_dir: Path) -> None:
     import zipfile
 
     dest_dir.mkdir(parents=True, exist_ok=True)
+    root = dest_dir.resolve()
     with zipfile.ZipFile(zip_path, 'r') as zf:
-        zf.extractall(dest_dir)
+        for info in zf.infolist():
+            target = (dest_dir / info.filename).resolve()
+            if root != target and root not in target.parents:
+                raise ValueError(f"Zip entry escapes destination: {info.filename}")
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Large copy buffer: sample payloads dominate archive size
+            with zf.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
 
 
 # =============================================================================
@@ -451,17 +588,55 @@ def unzip_project(zip_path: Path, dest_dir: Path) -> None:
 DEFAULT_TEMPLATE = "project-template-1.40B.zip"
 
 
+@functools.lru_cache(maxsize=None)
+def _template_bytes(name: str) -> bytes:
+    """Read an embedded template zip into memory (cached per template)."""
+    from importlib.resources import files
+
+    return files('octapy.templates').joinpath(name).read_bytes()
+
+
 def _get_template_zip(name: str = DEFAULT_TEMPLATE):
     """Get a ZipFile handle to an embedded template."""
     import zipfile
-    from importlib.resources import files
 
-    template_path = files('octapy.templates').joinpath(name)
-    return zipfile.ZipFile(template_path, 'r')
+    return zipfile.ZipFile(io.BytesIO(_template_bytes(name)), 'r')
+
+
+# Extracted template files up to this size (project.work, arr*.work) are
+# cached; larger ones (banks, markers) are extracted on demand so the
+# process doesn't keep a copy of each alive.
+_TEMPLATE_FILE_CACHE_LIMIT = 16 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _template_infos(template: str) -> Dict[str, zipfile.ZipInfo]:
+    """Map each file in a template zip to its directory entry (cached)."""
+    with _get_template_zip(template) as zf:
+        return {info.filename: info for info in zf.infolist()}
+
+
+@functools.lru_cache(maxsize=None)
+def _read_small_template_file(filename: str, template: str) -> bytes:
+    """Extract a small template file from its zip (cached)."""
+    with _get_template_zip(template) as zf:
+        return zf.read(filename)
+
+
+def template_file_crc(filename: str, template: str = DEFAULT_TEMPLATE) -> int:
+    """CRC-32 of a template file, read from the zip directory (no extraction)."""
+    return _template_infos(template)[filename].CRC
 
 
 def read_template_file(filename: str, template: str = DEFAULT_TEMPLATE) -> bytes:
-    """Read a single file from an embedded template zip."""
+    """Read a single file from an embedded template zip.
+
+    Small files are cached; large ones are extracted from the cached zip
+    bytes on each call.
+    """
+    info = _template_infos(template).get(filename)
+    if info is not None and info.file_size <= _TEMPLATE_FILE_CACHE_LIMIT:
+        return _read_small_template_file(filename, template)
     with _get_template_zip(template) as zf:
         return zf.read(filename)
 
@@ -9,6 +9,9 @@ Low-level file I/O (internal use):
     from octapy._io import BankFile, MarkersFile, ProjectFile
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .enums import (
     MachineType,
     ThruInput,
@@ -28,22 +31,89 @@ from .slot_manager import (
     InvalidSlotNumber,
 )
 
-# Core objects
-from .core import (
-    AudioRecorderSetup,
-    AudioStep,
-    MidiStep,
-    AudioPartTrack,
-    AudioPatternTrack,
-    MidiPartTrack,
-    MidiPatternTrack,
-    AudioSceneTrack,
-    Scene,
-    Part,
-    Pattern,
-    Bank,
-    Project,
-)
+if TYPE_CHECKING:
+    # Static view of the lazily imported names below, for type checkers/IDEs
+    from .core import (
+        AudioRecorderSetup,
+        AudioStep,
+        MidiStep,
+        AudioPartTrack,
+        AudioPatternTrack,
+        MidiPartTrack,
+        MidiPatternTrack,
+        AudioSceneTrack,
+        Scene,
+        Part,
+        Pattern,
+        Bank,
+        Project,
+    )
+    from .settings import Settings, RenderSettings
+    from .sample_pool import SamplePool
+
+# Core objects, settings and utilities are imported lazily on first
+# attribute access (PEP 562), so importing the package does not pay for
+# loading the whole object model up front.
+_LAZY = {
+    "AudioRecorderSetup": ".core",
+    "AudioStep": ".core",
+    "MidiStep": ".core",
+    "AudioPartTrack": ".core",
+    "AudioPatternTrack": ".core",
+    "MidiPartTrack": ".core",
+    "MidiPatternTrack": ".core",
+    "AudioSceneTrack": ".core",
+    "Scene": ".core",
+    "Part": ".core",
+    "Pattern": ".core",
+    "Bank": ".core",
+    "Project": ".core",
+    "Settings": ".settings",
+    "RenderSettings": ".settings",
+    "SamplePool": ".sample_pool",
+}
+
+__all__ = [
+    "MachineType",
+    "ThruInput",
+    "FX1Type",
+    "FX2Type",
+    "ScaleMode",
+    "PatternScale",
+    "TrigCondition",
+    "NoteLength",
+    "RecordingSource",
+    "RecTrigMode",
+    "QRecMode",
+    "OctapyError",
+    "SlotLimitExceeded",
+    "InvalidSlotNumber",
+    "AudioRecorderSetup",
+    "AudioStep",
+    "MidiStep",
+    "AudioPartTrack",
+    "AudioPatternTrack",
+    "MidiPartTrack",
+    "MidiPatternTrack",
+    "AudioSceneTrack",
+    "Scene",
+    "Part",
+    "Pattern",
+    "Bank",
+    "Project",
+    "Settings",
+    "RenderSettings",
+    "SamplePool",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
-from .settings import Settings, RenderSettings
-from .sample_pool import SamplePool
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -7,6 +7,9 @@ lookup table. Used for SRC, setup, AMP, and FX pages.
 
 from __future__ import annotations
 
+import sys
+from functools import partial
+from itertools import repeat
 from typing import Callable, Dict, List, Optional, Tuple
 
 from ..enums import FX1Type, FX2Type, MachineType
@@ -16,28 +19,30 @@ from ..enums import FX1Type, FX2Type, MachineType
 # Parameter name mappings
 # =============================================================================
 
+# Unused param positions are '' (never a valid attribute name).
+
 # SRC playback page: names depend on machine type (6 params)
-SRC_PARAM_NAMES: Dict[MachineType, Tuple[Optional[str], ...]] = {
+SRC_PARAM_NAMES: Dict[MachineType, Tuple[str, ...]] = {
     MachineType.FLEX: ('pitch', 'start', 'length', 'rate', 'retrig', 'retrig_time'),
     MachineType.STATIC: ('pitch', 'start', 'length', 'rate', 'retrig', 'retrig_time'),
-    MachineType.THRU: ('in_ab', 'vol_ab', None, 'in_cd', 'vol_cd', None),
-    MachineType.NEIGHBOR: (None, None, None, None, None, None),
-    MachineType.PICKUP: ('pitch', 'dir', 'length', None, 'gain', 'op'),
+    MachineType.THRU: ('in_ab', 'vol_ab', '', 'in_cd', 'vol_cd', ''),
+    MachineType.NEIGHBOR: ('', '', '', '', '', ''),
+    MachineType.PICKUP: ('pitch', 'dir', 'length', '', 'gain', 'op'),
 }
 
 # SRC setup page: names depend on machine type (6 params)
-SRC_SETUP_PARAM_NAMES: Dict[MachineType, Tuple[Optional[str], ...]] = {
+SRC_SETUP_PARAM_NAMES: Dict[MachineType, Tuple[str, ...]] = {
     MachineType.FLEX: ('loop', 'slice', 'length_mode', 'rate_mode', 'timestretch', 'timestretch_sensitivity'),
     MachineType.STATIC: ('loop', 'slice', 'length_mode', 'rate_mode', 'timestretch', 'timestretch_sensitivity'),
-    MachineType.THRU: (None, None, None, None, None, None),
-    MachineType.NEIGHBOR: (None, None, None, None, None, None),
-    MachineType.PICKUP: (None, None, None, None, None, None),
+    MachineType.THRU: ('', '', '', '', '', ''),
+    MachineType.NEIGHBOR: ('', '', '', '', '', ''),
+    MachineType.PICKUP: ('', '', '', '', '', ''),
 }
 
 # AMP page: fixed names, same for all machine types (5 params + 1 unused)
 _AMP_KEY = 'AMP'
-AMP_PARAM_NAMES: Dict[str, Tuple[Optional[str], ...]] = {
-    _AMP_KEY: ('attack', 'hold', 'release', 'volume', 'balance', None),
+AMP_PARAM_NAMES: Dict[str, Tuple[str, ...]] = {
+    _AMP_KEY: ('attack', 'hold', 'release', 'volume', 'balance', ''),
 }
 
 # Value transforms for parameters that need offset adjustment
@@ -49,25 +54,122 @@ SRC_VALUE_TRANSFORMS: Dict[str, Tuple[Callable, Callable, int, int]] = {
 }
 
 # FX pages: names depend on FX type (6 params)
-FX_PARAM_NAMES: Dict[int, Tuple[Optional[str], ...]] = {
-    FX1Type.OFF: (None, None, None, None, None, None),
+FX_PARAM_NAMES: Dict[int, Tuple[str, ...]] = {
+    FX1Type.OFF: ('', '', '', '', '', ''),
     FX1Type.FILTER: ('base', 'width', 'q', 'depth', 'attack', 'decay'),
     FX1Type.SPATIALIZER: ('input', 'depth', 'width', 'high_pass', 'low_pass', 'send'),
     FX2Type.DELAY: ('time', 'feedback', 'volume', 'base', 'width', 'send'),
     FX1Type.EQ: ('freq1', 'gain1', 'q1', 'freq2', 'gain2', 'q2'),
-    FX1Type.DJ_EQ: ('ls_f', None, 'rs_f', 'low_gain', 'mid_gain', 'high_gain'),
+    FX1Type.DJ_EQ: ('ls_f', '', 'rs_f', 'low_gain', 'mid_gain', 'high_gain'),
     FX1Type.PHASER: ('center', 'depth', 'spread', 'feedback', 'width', 'mix'),
     FX1Type.FLANGER: ('delay', 'depth', 'spread', 'feedback', 'width', 'mix'),
     FX1Type.CHORUS: ('delay', 'depth', 'spread', 'feedback', 'width', 'mix'),
-    FX1Type.COMB_FILTER: ('pitch', 'tune', 'low_pass', 'feedback', None, 'mix'),
+    FX1Type.COMB_FILTER: ('pitch', 'tune', 'low_pass', 'feedback', '', 'mix'),
     FX2Type.PLATE_REVERB: ('time', 'damp', 'gate', 'high_pass', 'low_pass', 'mix'),
-    FX2Type.SPRING_REVERB: ('time', None, None, 'high_pass', 'low_pass', 'mix'),
+    FX2Type.SPRING_REVERB: ('time', '', '', 'high_pass', 'low_pass', 'mix'),
     FX2Type.DARK_REVERB: ('time', 'shug', 'shuf', 'high_pass', 'low_pass', 'mix'),
     FX1Type.COMPRESSOR: ('attack', 'release', 'threshold', 'ratio', 'gain', 'mix'),
-    FX1Type.LOFI: ('dist', None, 'amf', 'srr', 'brr', 'amd'),
+    FX1Type.LOFI: ('dist', '', 'amf', 'srr', 'brr', 'amd'),
 }
 
 
+# Name -> index (1-6) lookups, keyed by the map's (immutable) contents so a
+# mutated or recreated map never picks up another map's index.
+_NAME_INDEX_CACHE: Dict[Tuple, Dict[object, Dict[str, int]]] = {}
+
+
+def _name_index_for(param_names_map: Dict) -> Dict[object, Dict[str, int]]:
+    """Get {type_key: {name: index}} for a param names map (cached)."""
+    key = tuple(param_names_map.items())
+    index = _NAME_INDEX_CACHE.get(key)
+    if index is None:
+        index = _NAME_INDEX_CACHE[key] = {
+            # Interned keys match attribute names by identity
+            type_key: {sys.intern(name): i for i, name in enumerate(names, 1) if name}
+            for type_key, names in key
+        }
+    return index
+
+
+# Reverse indexes for the module's own tables, built at import
+SRC_NAME_INDEX = _name_index_for(SRC_PARAM_NAMES)
+SRC_SETUP_NAME_INDEX = _name_index_for(SRC_SETUP_PARAM_NAMES)
+AMP_NAME_INDEX = _name_index_for(AMP_PARAM_NAMES)
+FX_NAME_INDEX = _name_index_for(FX_PARAM_NAMES)
+
+_EMPTY_INDEX: Dict[str, int] = {}
+
+# Never a type key; marks an empty last-type cache
+_NO_TYPE = object()
+
+# Shared names tuple for unknown/unset types
+_EMPTY_PARAMS: Tuple[str, ...] = ('',) * 6
+
+
+# Value transforms by param index (0 unused, 1-6), per type key
+_NO_TRANSFORMS: List[Optional[Tuple[Callable, Callable, int, int]]] = [None] * 7
+_TRANSFORM_INDEX_CACHE: Dict[Tuple[Tuple, Tuple], Dict[object, List]] = {}
+
+
+def _transform_index_for(param_names_map: Dict, value_transforms: Dict) -> Dict[object, List]:
+    """Get {type_key: [transform or None] * 7} for a names map and transforms (cached)."""
+    if not value_transforms:
+        return {}
+    items = tuple(param_names_map.items())
+    key = (items, tuple(value_transforms.items()))
+    index = _TRANSFORM_INDEX_CACHE.get(key)
+    if index is None:
+        index = _TRANSFORM_INDEX_CACHE[key] = {
+            type_key: [None] + [value_transforms.get(name) for name in names]
+            for type_key, names in items
+        }
+    return index
+
+
+def _fixed_type(type_key) -> Callable:
+    """Get a get_type callable for a type key that never changes (runs in C)."""
+    return repeat(type_key).__next__
+
+
+# Returned by PageAccessor._lookup for a name not valid for the type
+_MISSING = object()
+
+# Specialized accessor classes, one per distinct names tuple.
+_ACCESSOR_CLASSES: Dict[Tuple[str, ...], type] = {}
+
+
+def _make_param_getter(name: str, idx: int):
+    """Build a property getter for param `name` at index `idx` (1-6)."""
+    def fget(self):
+        type_key = self._get_type()
+        if self._param_names_map.get(type_key) != self._names:
+            # Type changed since the class was specialized
+            if name in self._index_for(type_key):
+                return self._lookup(type_key, name)
+            # Not valid for the new type: Python falls back to __getattr__,
+            # which does the (single) generic lookup and raises the full error
+            raise AttributeError(name)
+        raw_value = self._get_param(idx)
+        transform = self._transform_index.get(type_key, _NO_TRANSFORMS)[idx]
+        if transform is not None:
+            return transform[0](raw_value)
+        return raw_value
+    return fget
+
+
+def _accessor_class_for(names: Tuple[str, ...]) -> type:
+    """Get a PageAccessor subclass with a property per name in `names` (cached)."""
+    cls = _ACCESSOR_CLASSES.get(names)
+    if cls is None:
+        namespace = {'__slots__': (), '_names': names}
+        for i, name in enumerate(names, 1):
+            if name:
+                namespace[name] = property(_make_param_getter(name, i))
+        class_name = f"PageAccessor[{', '.join(name for name in names if name)}]"
+        cls = _ACCESSOR_CLASSES[names] = type(class_name, (PageAccessor,), namespace)
+    return cls
+
+
 # =============================================================================
 # PageAccessor
 # =============================================================================
@@ -85,9 +187,21 @@ class PageAccessor:
         track.setup.loop = 0         # SRC setup (machine-type-dependent)
         track.amp.attack = 10        # AMP page (fixed names)
         track.fx1.base = 100         # FX1 (FX-type-dependent)
+
+    Reads go through __getattr__ until the current type is known, then the
+    instance switches to a subclass with a real property per parameter name
+    so later reads skip the __getattr__ fallback. Writes always go through
+    __setattr__.
     """
 
-    __slots__ = ('_page_name', '_param_names_map', '_get_type', '_get_param', '_set_param', '_value_transforms')
+    # Names tuple the class is specialized for (None on the generic class)
+    _names: Optional[Tuple[str, ...]] = None
+
+    __slots__ = (
+        '_page_name', '_param_names_map', '_name_index', '_get_type',
+        '_get_param', '_set_param', '_transform_index',
+        '_setters', '_last_type', '_last_index', '_last_setters',
+    )
 
     def __init__(
         self,
@@ -112,69 +226,139 @@ class PageAccessor:
         """
         object.__setattr__(self, '_page_name', page_name)
         object.__setattr__(self, '_param_names_map', param_names_map)
+        object.__setattr__(self, '_name_index', _name_index_for(param_names_map))
         object.__setattr__(self, '_get_type', get_type)
         object.__setattr__(self, '_get_param', get_param)
         object.__setattr__(self, '_set_param', set_param)
-        object.__setattr__(self, '_value_transforms', value_transforms or {})
+        object.__setattr__(
+            self, '_transform_index', _transform_index_for(param_names_map, value_transforms or {})
+        )
+        # {type_key: {name: set_fn}} for params without a value transform
+        object.__setattr__(self, '_setters', {})
+        # Name index and setters for the most recently seen type key
+        object.__setattr__(self, '_last_type', _NO_TYPE)
+        object.__setattr__(self, '_last_index', _EMPTY_INDEX)
+        object.__setattr__(self, '_last_setters', {})
 
-    def _get_param_names(self) -> Tuple[Optional[str], ...]:
+    def _get_param_names(self) -> Tuple[str, ...]:
         """Get parameter names for current type."""
-        type_key = self._get_type()
-        if type_key is None:
-            return (None,) * 6
-        return self._param_names_map.get(type_key, (None,) * 6)
+        return self._param_names_map.get(self._get_type(), _EMPTY_PARAMS)
+
+    def _index_for(self, type_key) -> Dict[str, int]:
+        """Get the name -> index dict for a type key, via the last-type cache."""
+        if type_key is self._last_type:
+            return self._last_index
+        index = self._name_index.get(type_key, _EMPTY_INDEX)
+        setters = self._setters.get(type_key)
+        if setters is None:
+            # Bake the index into a partial for each untransformed param
+            transforms = self._transform_index.get(type_key, _NO_TRANSFORMS)
+            setters = self._setters[type_key] = {
+                name: partial(self._set_param, idx)
+                for name, idx in index.items() if transforms[idx] is None
+            }
+        object.__setattr__(self, '_last_type', type_key)
+        object.__setattr__(self, '_last_index', index)
+        object.__setattr__(self, '_last_setters', setters)
+        return index
 
     def _name_to_param_index(self, name: str) -> Optional[int]:
         """Convert parameter name to index (1-6) or None if not found."""
-        names = self._get_param_names()
-        if name in names:
-            return names.index(name) + 1
-        return None
+        return self._index_for(self._get_type()).get(name)
 
     def get_param_names(self) -> List[str]:
         """Get list of valid parameter names for current type."""
-        return [n for n in self._get_param_names() if n is not None]
+        return list(self._name_index.get(self._get_type(), _EMPTY_INDEX))
 
-    def __getattr__(self, name: str):
-        if name.startswith('_'):
-            return object.__getattribute__(self, name)
+    def set_params(self, **params) -> None:
+        """
+        Set several parameters at once.
 
-        idx = self._name_to_param_index(name)
-        if idx is not None:
-            raw_value = self._get_param(idx)
-            # Apply get transform if defined
-            if name in self._value_transforms:
-                get_transform, _, _, _ = self._value_transforms[name]
-                return get_transform(raw_value)
-            return raw_value
-
-        valid_names = self.get_param_names()
+        The current type is resolved once for the whole batch; each value is
+        then written as if assigned by name.
+
+        Usage:
+            track.fx1.set_params(base=64, width=100, q=20)
+        """
+        type_key = self._get_type()
+        if type_key is not self._last_type:
+            self._index_for(type_key)
+        setters = self._last_setters
+        for name, value in params.items():
+            set_fn = setters.get(name)
+            if set_fn is not None:
+                set_fn(value)
+            else:
+                self._set_slow(type_key, name, value)
+
+    def _raise_unknown(self, name: str):
+        """Raise AttributeError for a name that is not valid for the current type."""
         raise AttributeError(
             f"{self._page_name} page has no parameter '{name}'. "
-            f"Valid parameters: {valid_names}"
+            f"Valid parameters: {self.get_param_names()}"
         )
 
+    def __getattr__(self, name: str):
+        if name[:1] == '_':
+            # Only reached when normal lookup already failed
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        value = self._lookup(self._get_type(), name)
+        if value is _MISSING:
+            self._raise_unknown(name)
+        return value
+
+    def _lookup(self, type_key, name: str):
+        """Read param `name` for a type key, or return _MISSING if unknown.
+
+        Also specializes the instance's class to the type's names, so later
+        reads of those names hit a property instead of __getattr__.
+        """
+        names = self._param_names_map.get(type_key)
+        if names is not None and names != self._names:
+            object.__setattr__(self, '__class__', _accessor_class_for(names))
+
+        idx = self._index_for(type_key).get(name)
+        if idx is None:
+            return _MISSING
+        raw_value = self._get_param(idx)
+        # Apply get transform if defined
+        transform = self._transform_index.get(type_key, _NO_TRANSFORMS)[idx]
+        if transform is not None:
+            return transform[0](raw_value)
+        return raw_value
+
     def __setattr__(self, name: str, value):
-        if name.startswith('_'):
+        if name[:1] == '_':
             object.__setattr__(self, name, value)
             return
 
-        idx = self._name_to_param_index(name)
+        type_key = self._get_type()
+        # Last-type cache, inlined on the write path
+        if type_key is not self._last_type:
+            self._index_for(type_key)
+        set_fn = self._last_setters.get(name)
+        if set_fn is not None:
+            set_fn(value)
+            return
+
+        self._set_slow(type_key, name, value)
+
+    def _set_slow(self, type_key, name: str, value):
+        """Set a param that needs a value transform, or raise for an unknown name."""
+        idx = self._last_index.get(name)
         if idx is not None:
             # Apply set transform and validation if defined
-            if name in self._value_transforms:
-                _, set_transform, min_val, max_val = self._value_transforms[name]
+            transform = self._transform_index.get(type_key, _NO_TRANSFORMS)[idx]
+            if transform is not None:
+                _, set_transform, min_val, max_val = transform
                 if not min_val <= value <= max_val:
                     raise ValueError(f"{name} must be {min_val}-{max_val}, got {value}")
                 value = set_transform(value)
             self._set_param(idx, value)
             return
 
-        valid_names = self.get_param_names()
-        raise AttributeError(
-            f"{self._page_name} page has no parameter '{name}'. "
-            f"Valid parameters: {valid_names}"
-        )
+        self._raise_unknown(name)
 
     def __repr__(self) -> str:
         return f"PageAccessor({self._page_name})"
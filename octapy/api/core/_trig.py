@@ -5,6 +5,12 @@ These functions convert between step lists (1-64) and the 8-byte trig mask
 format used in the Octatrack binary format.
 """
 
+import struct
+
+
+# The 8-byte trig mask read as one big-endian word
+_MASK = struct.Struct('>Q')
+
 
 def _step_to_bit_position(step: int) -> tuple:
     """
@@ -44,6 +50,10 @@ def _trig_mask_to_steps(data: bytes, offset: int = 0) -> list:
     """
     Convert 8-byte trig mask to list of step numbers (1-64).
 
+    The byte layout above makes the mask a big-endian 64-bit word in which
+    bit (step - 1) is set for each active step, so the whole mask is read
+    in one call and only its set bits are visited.
+
     Args:
         data: Binary data containing the trig mask
         offset: Offset to the start of the 8-byte trig mask
@@ -51,41 +61,13 @@ def _trig_mask_to_steps(data: bytes, offset: int = 0) -> list:
     Returns:
         Sorted list of active step numbers (1-64)
     """
+    mask = _MASK.unpack_from(data, offset)[0]
     steps = []
-
-    # Page 1 (bytes 6-7): Steps 1-16
-    for bit in range(8):
-        if data[offset + 7] & (1 << bit):
-            steps.append(bit + 1)
-    for bit in range(8):
-        if data[offset + 6] & (1 << bit):
-            steps.append(bit + 9)
-
-    # Page 2 (bytes 4-5): Steps 17-32
-    for bit in range(8):
-        if data[offset + 5] & (1 << bit):
-            steps.append(bit + 17)
-    for bit in range(8):
-        if data[offset + 4] & (1 << bit):
-            steps.append(bit + 25)
-
-    # Page 3 (bytes 2-3): Steps 33-48
-    for bit in range(8):
-        if data[offset + 3] & (1 << bit):
-            steps.append(bit + 33)
-    for bit in range(8):
-        if data[offset + 2] & (1 << bit):
-            steps.append(bit + 41)
-
-    # Page 4 (bytes 0-1): Steps 49-64
-    for bit in range(8):
-        if data[offset + 1] & (1 << bit):
-            steps.append(bit + 49)
-    for bit in range(8):
-        if data[offset + 0] & (1 << bit):
-            steps.append(bit + 57)
-
-    return sorted(steps)
+    while mask:
+        low = mask & -mask
+        steps.append(low.bit_length())
+        mask ^= low
+    return steps
 
 
 def _steps_to_trig_mask(data: bytearray, offset: int, steps: list):
@@ -97,13 +79,8 @@ def _steps_to_trig_mask(data: bytearray, offset: int, steps: list):
         offset: Offset to the start of the 8-byte trig mask
         steps: List of active step numbers (1-64)
     """
-    # Clear existing mask
-    for i in range(8):
-        data[offset + i] = 0
-
+    mask = 0
     for step in steps:
-        if step < 1 or step > 64:
-            continue
-
-        byte_index, bit_position = _step_to_bit_position(step)
-        data[offset + byte_index] |= (1 << bit_position)
+        if 1 <= step <= 64:
+            mask |= 1 << (step - 1)
+    _MASK.pack_into(data, offset, mask)
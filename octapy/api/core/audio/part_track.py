@@ -7,10 +7,11 @@ with constructor arguments or read from Part binary data.
 
 from __future__ import annotations
 
-from enum import IntEnum
-from typing import Optional, TYPE_CHECKING
+from functools import partial
+from typing import Dict, Iterable, Optional, Tuple, TYPE_CHECKING
 
 from ...._io import (
+    PartOffset,
     MachineSlotOffset,
     MachineParamsOffset,
     AudioTrackParamsOffset,
@@ -18,6 +19,7 @@ from ...._io import (
     MACHINE_PARAMS_SIZE,
     AUDIO_TRACK_PARAMS_SIZE,
     RECORDER_SETUP_SIZE,
+    OCTAPY_DEFAULT_RECORDER_SETUP,
     FX_DEFAULTS,
     # Template (machine) defaults
     TEMPLATE_DEFAULT_SRC_VALUES,
@@ -31,13 +33,13 @@ from ...._io import (
     OCTAPY_DEFAULT_SRC_VALUES,
     OCTAPY_DEFAULT_SRC_SETUP,
 )
-from ...enums import MachineType, FX1Type, FX2Type
+from ...enums import MachineType, FX1Type, FX2Type, RecordingSource, ThruInput
 from .recorder import AudioRecorderSetup
-from .._page import PageAccessor, SRC_PARAM_NAMES, SRC_SETUP_PARAM_NAMES, AMP_PARAM_NAMES, FX_PARAM_NAMES, SRC_VALUE_TRANSFORMS, _AMP_KEY
+from .._page import PageAccessor, SRC_PARAM_NAMES, SRC_SETUP_PARAM_NAMES, AMP_PARAM_NAMES, FX_PARAM_NAMES, SRC_VALUE_TRANSFORMS, _AMP_KEY, _fixed_type
 
 
-class TrackDataOffset(IntEnum):
-    """Offsets within standalone AudioPartTrack buffer.
+class TrackDataOffset:
+    """Offsets within standalone AudioPartTrack buffer (plain ints).
 
     This is a contiguous layout for standalone storage:
     - 1 byte: machine_type
@@ -66,6 +68,137 @@ class TrackDataOffset(IntEnum):
 # Total size of standalone track buffer
 AUDIO_PART_TRACK_SIZE = 106
 
+# Absolute buffer offsets for the per-access properties, as plain ints
+_OFF_MACHINE_TYPE = TrackDataOffset.MACHINE_TYPE
+_OFF_FX1_TYPE = TrackDataOffset.FX1_TYPE
+_OFF_FX2_TYPE = TrackDataOffset.FX2_TYPE
+_OFF_VOLUME_MAIN = TrackDataOffset.VOLUME_MAIN
+_OFF_VOLUME_CUE = TrackDataOffset.VOLUME_CUE
+_OFF_FLEX_SLOT = TrackDataOffset.MACHINE_SLOTS + MachineSlotOffset.FLEX_SLOT_ID
+_OFF_STATIC_SLOT = TrackDataOffset.MACHINE_SLOTS + MachineSlotOffset.STATIC_SLOT_ID
+_OFF_FX1_PARAM1 = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM1
+_OFF_FX2_PARAM1 = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM1
+_OFF_AMP_ATK = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_ATK
+_OFF_AMP_HOLD = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_HOLD
+_OFF_AMP_REL = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_REL
+_OFF_AMP_VOL = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_VOL
+_OFF_AMP_BAL = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_BAL
+
+# Absolute offset for AMP param n (1=attack, 2=hold, 3=release, 4=volume,
+# 5=balance), indexed directly by the accessor's 1-based param number
+_AMP_OFFSETS = (None, _OFF_AMP_ATK, _OFF_AMP_HOLD, _OFF_AMP_REL, _OFF_AMP_VOL, _OFF_AMP_BAL)
+
+# MachineType member for each possible machine-type byte (None if invalid)
+_MACHINE_TYPE_BY_BYTE = tuple(MachineType._value2member_map_.get(i) for i in range(256))
+
+# Machine type to params offset mapping
+_MACHINE_PARAMS_OFFSET = {
+    MachineType.STATIC: MachineParamsOffset.STATIC,
+    MachineType.FLEX: MachineParamsOffset.FLEX,
+    MachineType.THRU: MachineParamsOffset.THRU,
+    MachineType.NEIGHBOR: MachineParamsOffset.NEIGHBOR,
+    MachineType.PICKUP: MachineParamsOffset.PICKUP,
+}
+
+# Absolute playback/setup params offset for each machine-type byte
+# (unknown bytes fall back to FLEX, as the dict lookup did)
+_VALUES_OFFSET_BY_BYTE = tuple(
+    TrackDataOffset.MACHINE_PARAMS_VALUES + _MACHINE_PARAMS_OFFSET.get(i, MachineParamsOffset.FLEX)
+    for i in range(256)
+)
+_SETUP_OFFSET_BY_BYTE = tuple(
+    TrackDataOffset.MACHINE_PARAMS_SETUP + _MACHINE_PARAMS_OFFSET.get(i, MachineParamsOffset.FLEX)
+    for i in range(256)
+)
+
+
+def _build_default_track_data() -> bytes:
+    """Build the standalone track buffer with template (machine) defaults."""
+    data = bytearray(AUDIO_PART_TRACK_SIZE)
+
+    # Machine type defaults to FLEX (but will be overwritten by constructor)
+    data[TrackDataOffset.MACHINE_TYPE] = int(MachineType.FLEX)
+
+    # FX types
+    data[TrackDataOffset.FX1_TYPE] = TEMPLATE_DEFAULT_FX1_TYPE
+    data[TrackDataOffset.FX2_TYPE] = TEMPLATE_DEFAULT_FX2_TYPE
+
+    # Volume
+    data[TrackDataOffset.VOLUME_MAIN] = 108
+    data[TrackDataOffset.VOLUME_CUE] = 108
+
+    # Machine slots (all 0)
+    data[TrackDataOffset.MACHINE_SLOTS:TrackDataOffset.MACHINE_SLOTS + MACHINE_SLOT_SIZE] = bytes(MACHINE_SLOT_SIZE)
+
+    # Machine params values - apply template SRC defaults for FLEX
+    offset = TrackDataOffset.MACHINE_PARAMS_VALUES + MachineParamsOffset.FLEX
+    data[offset:offset + 6] = TEMPLATE_DEFAULT_SRC_VALUES
+
+    # Machine params setup - apply template SRC defaults for FLEX
+    offset = TrackDataOffset.MACHINE_PARAMS_SETUP + MachineParamsOffset.FLEX
+    data[offset:offset + 6] = TEMPLATE_DEFAULT_SRC_SETUP
+
+    # Track params - AMP defaults
+    offset = TrackDataOffset.TRACK_PARAMS
+    data[offset:offset + 6] = TEMPLATE_DEFAULT_AMP
+
+    # FX1 params
+    offset = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM1
+    data[offset:offset + 6] = TEMPLATE_DEFAULT_FX1_PARAMS
+
+    # FX2 params
+    offset = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM1
+    data[offset:offset + 6] = TEMPLATE_DEFAULT_FX2_PARAMS
+
+    # Recorder setup will be handled by AudioRecorderSetup object
+
+    return bytes(data)
+
+
+# Default buffer, copied by each new AudioPartTrack
+_DEFAULT_TRACK_DATA = _build_default_track_data()
+
+
+# (part_field, size, buffer_offset) for each per-track field group.
+# Each group is stored in the Part as 8 consecutive per-track blocks of
+# `size` bytes, so track N's block starts at part_field + (N - 1) * size.
+# The recorder setup is handled separately by AudioRecorderSetup.
+_PART_LAYOUT: Tuple[Tuple[int, int, int], ...] = tuple(
+    (int(part_field), size, buffer_offset)
+    for part_field, size, buffer_offset in (
+        (PartOffset.AUDIO_TRACK_MACHINE_TYPES, 1, TrackDataOffset.MACHINE_TYPE),
+        (PartOffset.AUDIO_TRACK_FX1, 1, TrackDataOffset.FX1_TYPE),
+        (PartOffset.AUDIO_TRACK_FX2, 1, TrackDataOffset.FX2_TYPE),
+        (PartOffset.AUDIO_TRACK_VOLUMES, 2, TrackDataOffset.VOLUME_MAIN),
+        (PartOffset.AUDIO_TRACK_MACHINE_SLOTS, MACHINE_SLOT_SIZE, TrackDataOffset.MACHINE_SLOTS),
+        (PartOffset.AUDIO_TRACK_MACHINE_PARAMS_VALUES, MACHINE_PARAMS_SIZE, TrackDataOffset.MACHINE_PARAMS_VALUES),
+        (PartOffset.AUDIO_TRACK_MACHINE_PARAMS_SETUP, MACHINE_PARAMS_SIZE, TrackDataOffset.MACHINE_PARAMS_SETUP),
+        (PartOffset.AUDIO_TRACK_PARAMS_VALUES, AUDIO_TRACK_PARAMS_SIZE, TrackDataOffset.TRACK_PARAMS),
+    )
+)
+
+# Rows are in buffer order and cover the track data contiguously, so a
+# track's buffer is the concatenation of its layout slices followed by the
+# (unused) recorder bytes.
+_RECORDER_PAD = bytes(RECORDER_SETUP_SIZE)
+
+
+class _ByteField:
+    """Data descriptor for a 7-bit parameter byte in a track's _data buffer."""
+
+    def __init__(self, offset: int, doc: str, mask: int = 0x7F):
+        self.offset = offset
+        self.mask = mask
+        self.__doc__ = doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj._data[self.offset]
+
+    def __set__(self, obj, value: int):
+        obj._data[self.offset] = value & self.mask
+
 
 class AudioPartTrack:
     """
@@ -93,6 +226,11 @@ class AudioPartTrack:
         track.write_to_part(part_data, part_offset)
     """
 
+    __slots__ = (
+        '_track_num', '_data', '_recorder',
+        '_src_accessor', '_setup_accessor', '_amp_accessor', '_fx1_accessor', '_fx2_accessor',
+    )
+
     def __init__(
         self,
         track_num: int = 1,
@@ -136,10 +274,9 @@ class AudioPartTrack:
             recorder: AudioRecorderSetup object (or created with defaults)
         """
         self._track_num = track_num
-        self._data = bytearray(AUDIO_PART_TRACK_SIZE)
-
-        # Apply defaults
-        self._apply_defaults()
+        # Start from the template (machine) defaults
+        self._data = bytearray(_DEFAULT_TRACK_DATA)
+        self._init_accessors()
 
         # Apply constructor arguments
         self.machine_type = machine_type
@@ -163,50 +300,16 @@ class AudioPartTrack:
         self.amp_volume = amp_volume
         self.balance = balance
 
-        # Set recorder
-        if recorder is not None:
-            self._recorder = recorder
-        else:
-            self._recorder = AudioRecorderSetup()
+        # Set recorder (None: default setup, created on first access)
+        self._recorder = recorder
 
-    def _apply_defaults(self):
-        """Apply template (machine) default values to the buffer."""
-        # Machine type defaults to FLEX (but will be overwritten by constructor)
-        self._data[TrackDataOffset.MACHINE_TYPE] = int(MachineType.FLEX)
-
-        # FX types
-        self._data[TrackDataOffset.FX1_TYPE] = TEMPLATE_DEFAULT_FX1_TYPE
-        self._data[TrackDataOffset.FX2_TYPE] = TEMPLATE_DEFAULT_FX2_TYPE
-
-        # Volume
-        self._data[TrackDataOffset.VOLUME_MAIN] = 108
-        self._data[TrackDataOffset.VOLUME_CUE] = 108
-
-        # Machine slots (all 0)
-        for i in range(MACHINE_SLOT_SIZE):
-            self._data[TrackDataOffset.MACHINE_SLOTS + i] = 0
-
-        # Machine params values - apply template SRC defaults for FLEX
-        offset = TrackDataOffset.MACHINE_PARAMS_VALUES + MachineParamsOffset.FLEX
-        self._data[offset:offset + 6] = TEMPLATE_DEFAULT_SRC_VALUES
-
-        # Machine params setup - apply template SRC defaults for FLEX
-        offset = TrackDataOffset.MACHINE_PARAMS_SETUP + MachineParamsOffset.FLEX
-        self._data[offset:offset + 6] = TEMPLATE_DEFAULT_SRC_SETUP
-
-        # Track params - AMP defaults
-        offset = TrackDataOffset.TRACK_PARAMS
-        self._data[offset:offset + 6] = TEMPLATE_DEFAULT_AMP
-
-        # FX1 params
-        offset = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM1
-        self._data[offset:offset + 6] = TEMPLATE_DEFAULT_FX1_PARAMS
-
-        # FX2 params
-        offset = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM1
-        self._data[offset:offset + 6] = TEMPLATE_DEFAULT_FX2_PARAMS
-
-        # Recorder setup will be handled by AudioRecorderSetup object
+    def _init_accessors(self):
+        """Mark all page accessors as not yet built."""
+        self._src_accessor = None
+        self._setup_accessor = None
+        self._amp_accessor = None
+        self._fx1_accessor = None
+        self._fx2_accessor = None
 
     @classmethod
     def flex_with_recommended_defaults(
@@ -361,9 +464,7 @@ class AudioPartTrack:
             # Track 7 records 64 steps from the master output, looping playback
             part.track(7).configure_recorder(RecordingSource.MAIN, rlen=64, loop=True)
         """
-        from ...enums import RecordingSource as _RS
-
-        if not isinstance(source, _RS):
+        if not isinstance(source, RecordingSource):
             raise TypeError(f"source must be a RecordingSource, got {type(source).__name__}")
 
         self.machine_type = MachineType.FLEX
@@ -427,12 +528,10 @@ class AudioPartTrack:
             # Route both input pairs
             track.configure_thru(in_ab=ThruInput.A_PLUS_B, in_cd=ThruInput.A_PLUS_B)
         """
-        from ...enums import ThruInput as _TI
-
         if in_ab is None:
-            in_ab = _TI.A_PLUS_B
+            in_ab = ThruInput.A_PLUS_B
         if in_cd is None:
-            in_cd = _TI.OFF
+            in_cd = ThruInput.OFF
 
         self.machine_type = MachineType.THRU
         self.src.in_ab = in_ab
@@ -461,49 +560,20 @@ class AudioPartTrack:
         Returns:
             AudioPartTrack instance
         """
-        from ...._io import PartOffset
-
         instance = cls.__new__(cls)
         instance._track_num = track_num
-        instance._data = bytearray(AUDIO_PART_TRACK_SIZE)
+        instance._init_accessors()
 
         track_idx = track_num - 1
 
-        # Read machine type
-        offset = part_offset + PartOffset.AUDIO_TRACK_MACHINE_TYPES + track_idx
-        instance._data[TrackDataOffset.MACHINE_TYPE] = part_data[offset]
-
-        # Read FX types
-        offset = part_offset + PartOffset.AUDIO_TRACK_FX1 + track_idx
-        instance._data[TrackDataOffset.FX1_TYPE] = part_data[offset]
-
-        offset = part_offset + PartOffset.AUDIO_TRACK_FX2 + track_idx
-        instance._data[TrackDataOffset.FX2_TYPE] = part_data[offset]
-
-        # Read volumes
-        offset = part_offset + PartOffset.AUDIO_TRACK_VOLUMES + track_idx * 2
-        instance._data[TrackDataOffset.VOLUME_MAIN] = part_data[offset]
-        instance._data[TrackDataOffset.VOLUME_CUE] = part_data[offset + 1]
-
-        # Read machine slots
-        offset = part_offset + PartOffset.AUDIO_TRACK_MACHINE_SLOTS + track_idx * MACHINE_SLOT_SIZE
-        instance._data[TrackDataOffset.MACHINE_SLOTS:TrackDataOffset.MACHINE_SLOTS + MACHINE_SLOT_SIZE] = \
-            part_data[offset:offset + MACHINE_SLOT_SIZE]
-
-        # Read machine params values
-        offset = part_offset + PartOffset.AUDIO_TRACK_MACHINE_PARAMS_VALUES + track_idx * MACHINE_PARAMS_SIZE
-        instance._data[TrackDataOffset.MACHINE_PARAMS_VALUES:TrackDataOffset.MACHINE_PARAMS_VALUES + MACHINE_PARAMS_SIZE] = \
-            part_data[offset:offset + MACHINE_PARAMS_SIZE]
-
-        # Read machine params setup
-        offset = part_offset + PartOffset.AUDIO_TRACK_MACHINE_PARAMS_SETUP + track_idx * MACHINE_PARAMS_SIZE
-        instance._data[TrackDataOffset.MACHINE_PARAMS_SETUP:TrackDataOffset.MACHINE_PARAMS_SETUP + MACHINE_PARAMS_SIZE] = \
-            part_data[offset:offset + MACHINE_PARAMS_SIZE]
-
-        # Read track params
-        offset = part_offset + PartOffset.AUDIO_TRACK_PARAMS_VALUES + track_idx * AUDIO_TRACK_PARAMS_SIZE
-        instance._data[TrackDataOffset.TRACK_PARAMS:TrackDataOffset.TRACK_PARAMS + AUDIO_TRACK_PARAMS_SIZE] = \
-            part_data[offset:offset + AUDIO_TRACK_PARAMS_SIZE]
+        # Gather each field group from its per-track location in the Part
+        with memoryview(part_data) as view:
+            instance._data = bytearray().join([
+                *(view[part_offset + part_field + track_idx * size:
+                       part_offset + part_field + (track_idx + 1) * size]
+                  for part_field, size, _ in _PART_LAYOUT),
+                _RECORDER_PAD,
+            ])
 
         # Read recorder setup into AudioRecorderSetup object
         offset = part_offset + PartOffset.RECORDER_SETUP + track_idx * RECORDER_SETUP_SIZE
@@ -521,56 +591,103 @@ class AudioPartTrack:
             part_data: Part binary data (mutable bytearray)
             part_offset: Offset to Part in the data
         """
-        from ...._io import PartOffset
-
         track_idx = self._track_num - 1
 
-        # Write machine type
-        offset = part_offset + PartOffset.AUDIO_TRACK_MACHINE_TYPES + track_idx
-        part_data[offset] = self._data[TrackDataOffset.MACHINE_TYPE]
+        # Scatter each field group to its per-track location in the Part
+        with memoryview(self._data) as view:
+            for part_field, size, buffer_offset in _PART_LAYOUT:
+                offset = part_offset + part_field + track_idx * size
+                part_data[offset:offset + size] = view[buffer_offset:buffer_offset + size]
 
-        # Write FX types
-        offset = part_offset + PartOffset.AUDIO_TRACK_FX1 + track_idx
-        part_data[offset] = self._data[TrackDataOffset.FX1_TYPE]
+        # Write recorder setup
+        offset = part_offset + PartOffset.RECORDER_SETUP + track_idx * RECORDER_SETUP_SIZE
+        recorder = self._recorder
+        if recorder is None:
+            part_data[offset:offset + RECORDER_SETUP_SIZE] = OCTAPY_DEFAULT_RECORDER_SETUP
+        else:
+            recorder.write_into(part_data, offset)
 
-        offset = part_offset + PartOffset.AUDIO_TRACK_FX2 + track_idx
-        part_data[offset] = self._data[TrackDataOffset.FX2_TYPE]
+    @classmethod
+    def read_from_part_many(
+        cls,
+        part_data: bytes,
+        part_offset: int = 0,
+        track_nums: Iterable[int] = range(1, 9),
+    ) -> Dict[int, "AudioPartTrack"]:
+        """
+        Read several AudioPartTracks from Part binary data.
 
-        # Write volumes
-        offset = part_offset + PartOffset.AUDIO_TRACK_VOLUMES + track_idx * 2
-        part_data[offset] = self._data[TrackDataOffset.VOLUME_MAIN]
-        part_data[offset + 1] = self._data[TrackDataOffset.VOLUME_CUE]
+        Equivalent to calling read_from_part() for each track, but the
+        layout table and source memoryview are set up once for the batch.
 
-        # Write machine slots
-        offset = part_offset + PartOffset.AUDIO_TRACK_MACHINE_SLOTS + track_idx * MACHINE_SLOT_SIZE
-        part_data[offset:offset + MACHINE_SLOT_SIZE] = \
-            self._data[TrackDataOffset.MACHINE_SLOTS:TrackDataOffset.MACHINE_SLOTS + MACHINE_SLOT_SIZE]
+        Args:
+            part_data: Part binary data (or full bank data)
+            part_offset: Offset to Part in the data
+            track_nums: Track numbers to read (default 1-8)
 
-        # Write machine params values
-        offset = part_offset + PartOffset.AUDIO_TRACK_MACHINE_PARAMS_VALUES + track_idx * MACHINE_PARAMS_SIZE
-        part_data[offset:offset + MACHINE_PARAMS_SIZE] = \
-            self._data[TrackDataOffset.MACHINE_PARAMS_VALUES:TrackDataOffset.MACHINE_PARAMS_VALUES + MACHINE_PARAMS_SIZE]
+        Returns:
+            Dict mapping track number to AudioPartTrack
+        """
+        layout = _PART_LAYOUT
+        recorder_base = part_offset + PartOffset.RECORDER_SETUP
+        tracks = {}
+        with memoryview(part_data) as view:
+            for track_num in track_nums:
+                track_idx = track_num - 1
+                instance = cls.__new__(cls)
+                instance._track_num = track_num
+                instance._data = bytearray().join([
+                    *(view[part_offset + part_field + track_idx * size:
+                           part_offset + part_field + (track_idx + 1) * size]
+                      for part_field, size, _ in layout),
+                    _RECORDER_PAD,
+                ])
+                instance._init_accessors()
+                offset = recorder_base + track_idx * RECORDER_SETUP_SIZE
+                instance._recorder = AudioRecorderSetup.read(view[offset:offset + RECORDER_SETUP_SIZE])
+                tracks[track_num] = instance
+        return tracks
 
-        # Write machine params setup
-        offset = part_offset + PartOffset.AUDIO_TRACK_MACHINE_PARAMS_SETUP + track_idx * MACHINE_PARAMS_SIZE
-        part_data[offset:offset + MACHINE_PARAMS_SIZE] = \
-            self._data[TrackDataOffset.MACHINE_PARAMS_SETUP:TrackDataOffset.MACHINE_PARAMS_SETUP + MACHINE_PARAMS_SIZE]
+    @classmethod
+    def write_to_part_many(
+        cls,
+        tracks: Iterable["AudioPartTrack"],
+        part_data: bytearray,
+        part_offset: int = 0,
+    ):
+        """
+        Write several AudioPartTracks to Part binary data.
 
-        # Write track params
-        offset = part_offset + PartOffset.AUDIO_TRACK_PARAMS_VALUES + track_idx * AUDIO_TRACK_PARAMS_SIZE
-        part_data[offset:offset + AUDIO_TRACK_PARAMS_SIZE] = \
-            self._data[TrackDataOffset.TRACK_PARAMS:TrackDataOffset.TRACK_PARAMS + AUDIO_TRACK_PARAMS_SIZE]
+        Equivalent to calling write_to_part() on each track, with the
+        layout table looked up once for the batch.
 
-        # Write recorder setup
-        offset = part_offset + PartOffset.RECORDER_SETUP + track_idx * RECORDER_SETUP_SIZE
-        part_data[offset:offset + RECORDER_SETUP_SIZE] = self._recorder.write()
+        Args:
+            tracks: Tracks to write (each to its own track_num position)
+            part_data: Part binary data (mutable bytearray)
+            part_offset: Offset to Part in the data
+        """
+        layout = _PART_LAYOUT
+        recorder_base = part_offset + PartOffset.RECORDER_SETUP
+        for track in tracks:
+            track_idx = track._track_num - 1
+            with memoryview(track._data) as view:
+                for part_field, size, buffer_offset in layout:
+                    offset = part_offset + part_field + track_idx * size
+                    part_data[offset:offset + size] = view[buffer_offset:buffer_offset + size]
+            offset = recorder_base + track_idx * RECORDER_SETUP_SIZE
+            recorder = track._recorder
+            if recorder is None:
+                part_data[offset:offset + RECORDER_SETUP_SIZE] = OCTAPY_DEFAULT_RECORDER_SETUP
+            else:
+                recorder.write_into(part_data, offset)
 
     def clone(self) -> "AudioPartTrack":
         """Create a copy of this AudioPartTrack."""
         instance = AudioPartTrack.__new__(AudioPartTrack)
         instance._track_num = self._track_num
         instance._data = bytearray(self._data)
-        instance._recorder = self._recorder.clone()
+        instance._init_accessors()
+        instance._recorder = None if self._recorder is None else self._recorder.clone()
         return instance
 
     # === Basic properties ===
@@ -583,11 +700,15 @@ class AudioPartTrack:
     @property
     def machine_type(self) -> MachineType:
         """Get/set the machine type for this track."""
-        return MachineType(self._data[TrackDataOffset.MACHINE_TYPE])
+        value = self._data[_OFF_MACHINE_TYPE]
+        machine_type = _MACHINE_TYPE_BY_BYTE[value]
+        if machine_type is None:
+            return MachineType(value)  # Raises ValueError for unknown bytes
+        return machine_type
 
     @machine_type.setter
     def machine_type(self, value: MachineType):
-        self._data[TrackDataOffset.MACHINE_TYPE] = int(value)
+        self._data[_OFF_MACHINE_TYPE] = value
 
     # === Machine slots ===
     #
@@ -614,22 +735,24 @@ class AudioPartTrack:
             The sample slot index (0-127), or the raw value if >= 128
             (indicating recorder_slot is set instead).
         """
-        return self._data[TrackDataOffset.MACHINE_SLOTS + MachineSlotOffset.FLEX_SLOT_ID]
+        return self._data[_OFF_FLEX_SLOT]
 
     @flex_slot.setter
     def flex_slot(self, value: int):
         if not 0 <= value <= 127:
             raise ValueError(f"flex_slot must be 0-127, got {value}")
-        self._data[TrackDataOffset.MACHINE_SLOTS + MachineSlotOffset.FLEX_SLOT_ID] = value
+        self._data[_OFF_FLEX_SLOT] = value
 
     @property
     def static_slot(self) -> int:
-        """Get/set the static sample slot."""
-        return self._data[TrackDataOffset.MACHINE_SLOTS + MachineSlotOffset.STATIC_SLOT_ID]
+        """Get/set the static sample slot (0-127 for sample slots 1-128)."""
+        return self._data[_OFF_STATIC_SLOT]
 
     @static_slot.setter
     def static_slot(self, value: int):
-        self._data[TrackDataOffset.MACHINE_SLOTS + MachineSlotOffset.STATIC_SLOT_ID] = value & 0xFF
+        if not 0 <= value <= 127:
+            raise ValueError(f"static_slot must be 0-127, got {value}")
+        self._data[_OFF_STATIC_SLOT] = value
 
     @property
     def recorder_slot(self) -> Optional[int]:
@@ -645,7 +768,7 @@ class AudioPartTrack:
         Returns:
             The recorder buffer index (0-7), or None if flex_slot is set instead.
         """
-        val = self._data[TrackDataOffset.MACHINE_SLOTS + MachineSlotOffset.FLEX_SLOT_ID]
+        val = self._data[_OFF_FLEX_SLOT]
         if val >= 128:
             return val - 128
         return None
@@ -654,7 +777,7 @@ class AudioPartTrack:
     def recorder_slot(self, value: int):
         if not 0 <= value <= 7:
             raise ValueError(f"recorder_slot must be 0-7, got {value}")
-        self._data[TrackDataOffset.MACHINE_SLOTS + MachineSlotOffset.FLEX_SLOT_ID] = 128 + value
+        self._data[_OFF_FLEX_SLOT] = 128 + value
 
     # === Volume ===
 
@@ -662,156 +785,78 @@ class AudioPartTrack:
     def volume(self) -> tuple:
         """Get the volume as (main, cue) tuple."""
         return (
-            self._data[TrackDataOffset.VOLUME_MAIN],
-            self._data[TrackDataOffset.VOLUME_CUE],
+            self._data[_OFF_VOLUME_MAIN],
+            self._data[_OFF_VOLUME_CUE],
         )
 
     def set_volume(self, main: int = 108, cue: int = 108):
         """Set the volume (main and cue)."""
-        self._data[TrackDataOffset.VOLUME_MAIN] = main & 0x7F
-        self._data[TrackDataOffset.VOLUME_CUE] = cue & 0x7F
+        self._data[_OFF_VOLUME_MAIN] = main & 0x7F
+        self._data[_OFF_VOLUME_CUE] = cue & 0x7F
 
     # === FX types ===
 
     @property
     def fx1_type(self) -> int:
         """Get/set the FX1 type."""
-        return self._data[TrackDataOffset.FX1_TYPE]
+        return self._data[_OFF_FX1_TYPE]
 
     @fx1_type.setter
     def fx1_type(self, value: int):
-        self._data[TrackDataOffset.FX1_TYPE] = value
+        self._data[_OFF_FX1_TYPE] = value
         # Apply FX type defaults
-        if value in FX_DEFAULTS:
-            offset = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM1
-            self._data[offset:offset + 6] = FX_DEFAULTS[value]
+        defaults = FX_DEFAULTS.get(value)
+        if defaults is not None:
+            self._data[_OFF_FX1_PARAM1:_OFF_FX1_PARAM1 + 6] = defaults
 
     @property
     def fx2_type(self) -> int:
         """Get/set the FX2 type."""
-        return self._data[TrackDataOffset.FX2_TYPE]
+        return self._data[_OFF_FX2_TYPE]
 
     @fx2_type.setter
     def fx2_type(self, value: int):
-        self._data[TrackDataOffset.FX2_TYPE] = value
+        self._data[_OFF_FX2_TYPE] = value
         # Apply FX type defaults
-        if value in FX_DEFAULTS:
-            offset = TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM1
-            self._data[offset:offset + 6] = FX_DEFAULTS[value]
+        defaults = FX_DEFAULTS.get(value)
+        if defaults is not None:
+            self._data[_OFF_FX2_PARAM1:_OFF_FX2_PARAM1 + 6] = defaults
 
     # === FX1 params ===
 
-    @property
-    def fx1_param1(self) -> int:
-        """Get/set FX1 parameter 1 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM1]
-
-    @fx1_param1.setter
-    def fx1_param1(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM1] = value & 0x7F
-
-    @property
-    def fx1_param2(self) -> int:
-        """Get/set FX1 parameter 2 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM2]
-
-    @fx1_param2.setter
-    def fx1_param2(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM2] = value & 0x7F
-
-    @property
-    def fx1_param3(self) -> int:
-        """Get/set FX1 parameter 3 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM3]
-
-    @fx1_param3.setter
-    def fx1_param3(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM3] = value & 0x7F
-
-    @property
-    def fx1_param4(self) -> int:
-        """Get/set FX1 parameter 4 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM4]
-
-    @fx1_param4.setter
-    def fx1_param4(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM4] = value & 0x7F
-
-    @property
-    def fx1_param5(self) -> int:
-        """Get/set FX1 parameter 5 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM5]
-
-    @fx1_param5.setter
-    def fx1_param5(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM5] = value & 0x7F
-
-    @property
-    def fx1_param6(self) -> int:
-        """Get/set FX1 parameter 6 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM6]
-
-    @fx1_param6.setter
-    def fx1_param6(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM6] = value & 0x7F
+    fx1_param1 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM1, "Get/set FX1 parameter 1 (0-127).")
+    fx1_param2 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM2, "Get/set FX1 parameter 2 (0-127).")
+    fx1_param3 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM3, "Get/set FX1 parameter 3 (0-127).")
+    fx1_param4 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM4, "Get/set FX1 parameter 4 (0-127).")
+    fx1_param5 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM5, "Get/set FX1 parameter 5 (0-127).")
+    fx1_param6 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX1_PARAM6, "Get/set FX1 parameter 6 (0-127).")
 
     # === FX2 params ===
 
-    @property
-    def fx2_param1(self) -> int:
-        """Get/set FX2 parameter 1 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM1]
-
-    @fx2_param1.setter
-    def fx2_param1(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM1] = value & 0x7F
-
-    @property
-    def fx2_param2(self) -> int:
-        """Get/set FX2 parameter 2 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM2]
-
-    @fx2_param2.setter
-    def fx2_param2(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM2] = value & 0x7F
-
-    @property
-    def fx2_param3(self) -> int:
-        """Get/set FX2 parameter 3 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM3]
-
-    @fx2_param3.setter
-    def fx2_param3(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM3] = value & 0x7F
+    fx2_param1 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM1, "Get/set FX2 parameter 1 (0-127).")
+    fx2_param2 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM2, "Get/set FX2 parameter 2 (0-127).")
+    fx2_param3 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM3, "Get/set FX2 parameter 3 (0-127).")
+    fx2_param4 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM4, "Get/set FX2 parameter 4 (0-127).")
+    fx2_param5 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM5, "Get/set FX2 parameter 5 (0-127).")
+    fx2_param6 = _ByteField(TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM6, "Get/set FX2 parameter 6 (0-127).")
 
-    @property
-    def fx2_param4(self) -> int:
-        """Get/set FX2 parameter 4 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM4]
-
-    @fx2_param4.setter
-    def fx2_param4(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM4] = value & 0x7F
-
-    @property
-    def fx2_param5(self) -> int:
-        """Get/set FX2 parameter 5 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM5]
+    # === FX Accessors (named parameter access) ===
 
-    @fx2_param5.setter
-    def fx2_param5(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM5] = value & 0x7F
+    def _get_fx1_param(self, n: int) -> int:
+        """Get FX1 param n (1-6)."""
+        return self._data[_OFF_FX1_PARAM1 + (n - 1)]
 
-    @property
-    def fx2_param6(self) -> int:
-        """Get/set FX2 parameter 6 (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM6]
+    def _set_fx1_param(self, n: int, value: int):
+        """Set FX1 param n (1-6)."""
+        self._data[_OFF_FX1_PARAM1 + (n - 1)] = value & 0x7F
 
-    @fx2_param6.setter
-    def fx2_param6(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.FX2_PARAM6] = value & 0x7F
+    def _get_fx2_param(self, n: int) -> int:
+        """Get FX2 param n (1-6)."""
+        return self._data[_OFF_FX2_PARAM1 + (n - 1)]
 
-    # === FX Accessors (named parameter access) ===
+    def _set_fx2_param(self, n: int, value: int):
+        """Set FX2 param n (1-6)."""
+        self._data[_OFF_FX2_PARAM1 + (n - 1)] = value & 0x7F
 
     @property
     def fx1(self) -> PageAccessor:
@@ -822,13 +867,13 @@ class AudioPartTrack:
             track.fx1.base = 64      # FX1Type.FILTER param1
             track.fx1.delay = 64     # FX1Type.CHORUS param1
         """
-        if not hasattr(self, '_fx1_accessor'):
+        if self._fx1_accessor is None:
             self._fx1_accessor = PageAccessor(
                 page_name='FX1',
                 param_names_map=FX_PARAM_NAMES,
-                get_type=lambda: self.fx1_type,
-                get_param=lambda n: getattr(self, f'fx1_param{n}'),
-                set_param=lambda n, v: setattr(self, f'fx1_param{n}', v),
+                get_type=partial(self._data.__getitem__, _OFF_FX1_TYPE),
+                get_param=self._get_fx1_param,
+                set_param=self._set_fx1_param,
             )
         return self._fx1_accessor
 
@@ -841,68 +886,31 @@ class AudioPartTrack:
             track.fx2.time = 64      # FX2Type.DELAY param1
             track.fx2.mix = 100      # FX2Type.PLATE_REVERB param6
         """
-        if not hasattr(self, '_fx2_accessor'):
+        if self._fx2_accessor is None:
             self._fx2_accessor = PageAccessor(
                 page_name='FX2',
                 param_names_map=FX_PARAM_NAMES,
-                get_type=lambda: self.fx2_type,
-                get_param=lambda n: getattr(self, f'fx2_param{n}'),
-                set_param=lambda n, v: setattr(self, f'fx2_param{n}', v),
+                get_type=partial(self._data.__getitem__, _OFF_FX2_TYPE),
+                get_param=self._get_fx2_param,
+                set_param=self._set_fx2_param,
             )
         return self._fx2_accessor
 
     # === AMP page (deprecated bare properties — use track.amp.* instead) ===
 
-    @property
-    def attack(self) -> int:
-        """Get/set amplitude attack (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_ATK]
-
-    @attack.setter
-    def attack(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_ATK] = value & 0x7F
-
-    @property
-    def hold(self) -> int:
-        """Get/set amplitude hold (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_HOLD]
-
-    @hold.setter
-    def hold(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_HOLD] = value & 0x7F
-
-    @property
-    def release(self) -> int:
-        """Get/set amplitude release (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_REL]
-
-    @release.setter
-    def release(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_REL] = value & 0x7F
-
-    @property
-    def amp_volume(self) -> int:
-        """Get/set amplitude volume (0-127)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_VOL]
-
-    @amp_volume.setter
-    def amp_volume(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_VOL] = value & 0x7F
-
-    @property
-    def balance(self) -> int:
-        """Get/set amplitude balance (0-127, 64 = center)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_BAL]
-
-    @balance.setter
-    def balance(self, value: int):
-        self._data[TrackDataOffset.TRACK_PARAMS + AudioTrackParamsOffset.AMP_BAL] = value & 0x7F
+    attack = _ByteField(_OFF_AMP_ATK, "Get/set amplitude attack (0-127).")
+    hold = _ByteField(_OFF_AMP_HOLD, "Get/set amplitude hold (0-127).")
+    release = _ByteField(_OFF_AMP_REL, "Get/set amplitude release (0-127).")
+    amp_volume = _ByteField(_OFF_AMP_VOL, "Get/set amplitude volume (0-127).")
+    balance = _ByteField(_OFF_AMP_BAL, "Get/set amplitude balance (0-127, 64 = center).")
 
     # === Recorder ===
 
     @property
     def recorder(self) -> AudioRecorderSetup:
         """Get recorder buffer configuration for this track."""
+        if self._recorder is None:
+            self._recorder = AudioRecorderSetup()
         return self._recorder
 
     @recorder.setter
@@ -912,57 +920,36 @@ class AudioPartTrack:
 
     # === SRC/Playback page ===
 
-    # Machine type to params offset mapping
-    _MACHINE_PARAMS_OFFSET = {
-        MachineType.STATIC: MachineParamsOffset.STATIC,
-        MachineType.FLEX: MachineParamsOffset.FLEX,
-        MachineType.THRU: MachineParamsOffset.THRU,
-        MachineType.NEIGHBOR: MachineParamsOffset.NEIGHBOR,
-        MachineType.PICKUP: MachineParamsOffset.PICKUP,
-    }
-
-    def _machine_values_offset(self) -> int:
-        """Get offset for current machine's playback params in buffer."""
-        offset = self._MACHINE_PARAMS_OFFSET.get(self.machine_type, MachineParamsOffset.FLEX)
-        return TrackDataOffset.MACHINE_PARAMS_VALUES + offset
-
-    def _machine_setup_offset(self) -> int:
-        """Get offset for current machine's setup params in buffer."""
-        offset = self._MACHINE_PARAMS_OFFSET.get(self.machine_type, MachineParamsOffset.FLEX)
-        return TrackDataOffset.MACHINE_PARAMS_SETUP + offset
+    # The machine type byte is re-read on every access (it can change under
+    # the accessor), but resolving it is a single byte-indexed table lookup.
 
     def _get_playback_param(self, n: int) -> int:
         """Get playback param n (1-6) for current machine type."""
-        return self._data[self._machine_values_offset() + (n - 1)]
+        data = self._data
+        return data[_VALUES_OFFSET_BY_BYTE[data[_OFF_MACHINE_TYPE]] + n - 1]
 
     def _set_playback_param(self, n: int, value: int):
         """Set playback param n (1-6) for current machine type."""
-        self._data[self._machine_values_offset() + (n - 1)] = value & 0x7F
+        data = self._data
+        data[_VALUES_OFFSET_BY_BYTE[data[_OFF_MACHINE_TYPE]] + n - 1] = value & 0x7F
 
     def _get_setup_param(self, n: int) -> int:
         """Get setup param n (1-6) for current machine type."""
-        return self._data[self._machine_setup_offset() + (n - 1)]
+        data = self._data
+        return data[_SETUP_OFFSET_BY_BYTE[data[_OFF_MACHINE_TYPE]] + n - 1]
 
     def _set_setup_param(self, n: int, value: int):
         """Set setup param n (1-6) for current machine type."""
-        self._data[self._machine_setup_offset() + (n - 1)] = value & 0x7F
-
-    # AMP param indices: 1=attack, 2=hold, 3=release, 4=volume, 5=balance
-    _AMP_OFFSETS = (
-        AudioTrackParamsOffset.AMP_ATK,
-        AudioTrackParamsOffset.AMP_HOLD,
-        AudioTrackParamsOffset.AMP_REL,
-        AudioTrackParamsOffset.AMP_VOL,
-        AudioTrackParamsOffset.AMP_BAL,
-    )
+        data = self._data
+        data[_SETUP_OFFSET_BY_BYTE[data[_OFF_MACHINE_TYPE]] + n - 1] = value & 0x7F
 
     def _get_amp_param(self, n: int) -> int:
         """Get AMP param n (1=attack, 2=hold, 3=release, 4=volume, 5=balance)."""
-        return self._data[TrackDataOffset.TRACK_PARAMS + self._AMP_OFFSETS[n - 1]]
+        return self._data[_AMP_OFFSETS[n]]
 
     def _set_amp_param(self, n: int, value: int):
         """Set AMP param n (1=attack, 2=hold, 3=release, 4=volume, 5=balance)."""
-        self._data[TrackDataOffset.TRACK_PARAMS + self._AMP_OFFSETS[n - 1]] = value & 0x7F
+        self._data[_AMP_OFFSETS[n]] = value & 0x7F
 
     @property
     def src(self) -> PageAccessor:
@@ -974,11 +961,11 @@ class AudioPartTrack:
             track.src.retrig = 2         # Play sample twice (1-128)
             track.src.in_ab = 1          # Thru param1
         """
-        if not hasattr(self, '_src_accessor'):
+        if self._src_accessor is None:
             self._src_accessor = PageAccessor(
                 page_name='SRC',
                 param_names_map=SRC_PARAM_NAMES,
-                get_type=lambda: self.machine_type,
+                get_type=partial(self._data.__getitem__, _OFF_MACHINE_TYPE),
                 get_param=self._get_playback_param,
                 set_param=self._set_playback_param,
                 value_transforms=SRC_VALUE_TRANSFORMS,
@@ -995,11 +982,11 @@ class AudioPartTrack:
             track.setup.length_mode = 1       # Flex/Static: TIME mode
             track.setup.timestretch = 1       # Flex/Static: AUTO
         """
-        if not hasattr(self, '_setup_accessor'):
+        if self._setup_accessor is None:
             self._setup_accessor = PageAccessor(
                 page_name='setup',
                 param_names_map=SRC_SETUP_PARAM_NAMES,
-                get_type=lambda: self.machine_type,
+                get_type=partial(self._data.__getitem__, _OFF_MACHINE_TYPE),
                 get_param=self._get_setup_param,
                 set_param=self._set_setup_param,
             )
@@ -1015,11 +1002,11 @@ class AudioPartTrack:
             track.amp.volume = 108
             track.amp.balance = 64
         """
-        if not hasattr(self, '_amp_accessor'):
+        if self._amp_accessor is None:
             self._amp_accessor = PageAccessor(
                 page_name='AMP',
                 param_names_map=AMP_PARAM_NAMES,
-                get_type=lambda: _AMP_KEY,
+                get_type=_fixed_type(_AMP_KEY),
                 get_param=self._get_amp_param,
                 set_param=self._set_amp_param,
             )
@@ -1029,28 +1016,30 @@ class AudioPartTrack:
 
     def to_dict(self) -> dict:
         """Convert audio part track to dictionary."""
+        data = self._data
         result = {
             "track": self._track_num,
             "machine_type": self.machine_type.name,
-            "static_slot": self.static_slot,
-            "volume": {"main": self.volume[0], "cue": self.volume[1]},
+            "static_slot": data[_OFF_STATIC_SLOT],
+            "volume": {"main": data[_OFF_VOLUME_MAIN], "cue": data[_OFF_VOLUME_CUE]},
             "amp": {
-                "attack": self.attack,
-                "hold": self.hold,
-                "release": self.release,
-                "volume": self.amp_volume,
-                "balance": self.balance,
+                "attack": data[_OFF_AMP_ATK],
+                "hold": data[_OFF_AMP_HOLD],
+                "release": data[_OFF_AMP_REL],
+                "volume": data[_OFF_AMP_VOL],
+                "balance": data[_OFF_AMP_BAL],
             },
-            "fx1_type": self.fx1_type,
-            "fx2_type": self.fx2_type,
-            "recorder": self._recorder.to_dict(),
+            "fx1_type": data[_OFF_FX1_TYPE],
+            "fx2_type": data[_OFF_FX2_TYPE],
+            "recorder": self.recorder.to_dict(),
         }
         # flex_slot and recorder_slot are mutually exclusive
-        rec_slot = self.recorder_slot
-        if rec_slot is not None:
-            result["recorder_slot"] = rec_slot
+        # (FLEX_SLOT_ID values 128-135 select recorder buffers 0-7)
+        flex_slot = data[_OFF_FLEX_SLOT]
+        if flex_slot >= 128:
+            result["recorder_slot"] = flex_slot - 128
         else:
-            result["flex_slot"] = self.flex_slot
+            result["flex_slot"] = flex_slot
         return result
 
     @classmethod
@@ -1103,8 +1092,13 @@ class AudioPartTrack:
         return (
             self._track_num == other._track_num
             and self._data == other._data
-            and self._recorder == other._recorder
+            and self._recorder_bytes() == other._recorder_bytes()
         )
 
+    def _recorder_bytes(self):
+        """Recorder bytes as written, without building an unbuilt recorder."""
+        recorder = self._recorder
+        return OCTAPY_DEFAULT_RECORDER_SETUP if recorder is None else recorder._data
+
     def __repr__(self) -> str:
         return f"AudioPartTrack(track={self._track_num}, machine_type={self.machine_type.name})"
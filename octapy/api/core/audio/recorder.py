@@ -139,6 +139,16 @@ class AudioRecorderSetup:
         """
         return bytes(self._data)
 
+    def write_into(self, dst: bytearray, offset: int) -> None:
+        """
+        Write this AudioRecorderSetup directly into a destination buffer.
+
+        Args:
+            dst: Mutable buffer to write into
+            offset: Offset in dst of the RECORDER_SETUP_SIZE (12) byte block
+        """
+        dst[offset:offset + RECORDER_SETUP_SIZE] = self._data
+
     def clone(self) -> "AudioRecorderSetup":
         """
         Create a copy of this AudioRecorderSetup.
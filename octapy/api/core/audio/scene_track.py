@@ -7,11 +7,12 @@ with constructor arguments or read from Part binary data.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Optional
 
 from ...._io import SceneParamsOffset, SCENE_PARAMS_SIZE, SCENE_LOCK_DISABLED
 from ...enums import MachineType
-from .._page import PageAccessor, SRC_PARAM_NAMES, SRC_SETUP_PARAM_NAMES, AMP_PARAM_NAMES, FX_PARAM_NAMES, SRC_VALUE_TRANSFORMS, _AMP_KEY
+from .._page import PageAccessor, SRC_PARAM_NAMES, SRC_SETUP_PARAM_NAMES, AMP_PARAM_NAMES, FX_PARAM_NAMES, SRC_VALUE_TRANSFORMS, _AMP_KEY, _fixed_type
 
 
 class AudioSceneTrack:
@@ -96,6 +97,7 @@ class AudioSceneTrack:
         self._fx2_type = fx2_type
         # Initialize all locks to disabled (255)
         self._data = bytearray([SCENE_LOCK_DISABLED] * SCENE_PARAMS_SIZE)
+        self._init_accessors()
 
         # Apply any provided locks
         if playback_param1 is not None:
@@ -161,6 +163,13 @@ class AudioSceneTrack:
         if fx2_param6 is not None:
             self.fx2_param6 = fx2_param6
 
+    def _init_accessors(self):
+        """Mark all page accessors as not yet built."""
+        self._src_accessor = None
+        self._amp_accessor = None
+        self._fx1_accessor = None
+        self._fx2_accessor = None
+
     @classmethod
     def read(
         cls,
@@ -189,6 +198,7 @@ class AudioSceneTrack:
         instance._fx1_type = fx1_type
         instance._fx2_type = fx2_type
         instance._data = bytearray(track_data[:SCENE_PARAMS_SIZE])
+        instance._init_accessors()
         return instance
 
     def write(self) -> bytes:
@@ -208,6 +218,7 @@ class AudioSceneTrack:
         instance._fx1_type = self._fx1_type
         instance._fx2_type = self._fx2_type
         instance._data = bytearray(self._data)
+        instance._init_accessors()
         return instance
 
     # === Basic properties ===
@@ -370,13 +381,23 @@ class AudioSceneTrack:
 
     # === Dynamic accessors (named parameter access) ===
 
+    # AMP param offsets indexed by 1-based param number:
+    # 1=attack, 2=hold, 3=release, 4=volume, 5=balance
+    _AMP_OFFSETS = (None,) + tuple(int(offset) for offset in (
+        SceneParamsOffset.AMP_ATK,
+        SceneParamsOffset.AMP_HOLD,
+        SceneParamsOffset.AMP_REL,
+        SceneParamsOffset.AMP_VOL,
+        SceneParamsOffset.AMP_BAL,
+    ))
+
     def _get_playback_param(self, n: int) -> Optional[int]:
         """Get playback param n (1-6)."""
-        return getattr(self, f'playback_param{n}')
+        return self._get_lock(SceneParamsOffset.PLAYBACK_PARAM1 + (n - 1))
 
     def _set_playback_param(self, n: int, value: Optional[int]):
         """Set playback param n (1-6)."""
-        setattr(self, f'playback_param{n}', value)
+        self._set_lock(SceneParamsOffset.PLAYBACK_PARAM1 + (n - 1), value)
 
     @property
     def src(self) -> PageAccessor:
@@ -388,11 +409,11 @@ class AudioSceneTrack:
             track.src.retrig = 2       # Lock retrig to 2 plays
             track.src.in_ab = 1        # Lock in_ab to 1 (Thru)
         """
-        if not hasattr(self, '_src_accessor'):
+        if self._src_accessor is None:
             self._src_accessor = PageAccessor(
                 page_name='SRC',
                 param_names_map=SRC_PARAM_NAMES,
-                get_type=lambda: self._machine_type,
+                get_type=partial(getattr, self, '_machine_type'),
                 get_param=self._get_playback_param,
                 set_param=self._set_playback_param,
                 value_transforms=SRC_VALUE_TRANSFORMS,
@@ -408,11 +429,11 @@ class AudioSceneTrack:
             track.amp.attack = 10
             track.amp.volume = 100
         """
-        if not hasattr(self, '_amp_accessor'):
+        if self._amp_accessor is None:
             self._amp_accessor = PageAccessor(
                 page_name='AMP',
                 param_names_map=AMP_PARAM_NAMES,
-                get_type=lambda: _AMP_KEY,
+                get_type=_fixed_type(_AMP_KEY),
                 get_param=self._get_amp_param,
                 set_param=self._set_amp_param,
             )
@@ -420,21 +441,19 @@ class AudioSceneTrack:
 
     def _get_amp_param(self, n: int) -> Optional[int]:
         """Get AMP param n (1=attack, 2=hold, 3=release, 4=volume, 5=balance)."""
-        _AMP_ATTRS = ('amp_attack', 'amp_hold', 'amp_release', 'amp_volume', 'amp_balance')
-        return getattr(self, _AMP_ATTRS[n - 1])
+        return self._get_lock(self._AMP_OFFSETS[n])
 
     def _set_amp_param(self, n: int, value: Optional[int]):
         """Set AMP param n (1=attack, 2=hold, 3=release, 4=volume, 5=balance)."""
-        _AMP_ATTRS = ('amp_attack', 'amp_hold', 'amp_release', 'amp_volume', 'amp_balance')
-        setattr(self, _AMP_ATTRS[n - 1], value)
+        self._set_lock(self._AMP_OFFSETS[n], value)
 
     def _get_fx1_param(self, n: int) -> Optional[int]:
         """Get FX1 param n (1-6)."""
-        return getattr(self, f'fx1_param{n}')
+        return self._get_lock(SceneParamsOffset.FX1_PARAM1 + (n - 1))
 
     def _set_fx1_param(self, n: int, value: Optional[int]):
         """Set FX1 param n (1-6)."""
-        setattr(self, f'fx1_param{n}', value)
+        self._set_lock(SceneParamsOffset.FX1_PARAM1 + (n - 1), value)
 
     @property
     def fx1(self) -> PageAccessor:
@@ -444,11 +463,11 @@ class AudioSceneTrack:
         Usage:
             track.fx1.base = 64      # Lock filter base to 64
         """
-        if not hasattr(self, '_fx1_accessor'):
+        if self._fx1_accessor is None:
             self._fx1_accessor = PageAccessor(
                 page_name='FX1',
                 param_names_map=FX_PARAM_NAMES,
-                get_type=lambda: self._fx1_type,
+                get_type=partial(getattr, self, '_fx1_type'),
                 get_param=self._get_fx1_param,
                 set_param=self._set_fx1_param,
             )
@@ -456,11 +475,11 @@ class AudioSceneTrack:
 
     def _get_fx2_param(self, n: int) -> Optional[int]:
         """Get FX2 param n (1-6)."""
-        return getattr(self, f'fx2_param{n}')
+        return self._get_lock(SceneParamsOffset.FX2_PARAM1 + (n - 1))
 
     def _set_fx2_param(self, n: int, value: Optional[int]):
         """Set FX2 param n (1-6)."""
-        setattr(self, f'fx2_param{n}', value)
+        self._set_lock(SceneParamsOffset.FX2_PARAM1 + (n - 1), value)
 
     @property
     def fx2(self) -> PageAccessor:
@@ -470,11 +489,11 @@ class AudioSceneTrack:
         Usage:
             track.fx2.time = 64      # Lock delay time to 64
         """
-        if not hasattr(self, '_fx2_accessor'):
+        if self._fx2_accessor is None:
             self._fx2_accessor = PageAccessor(
                 page_name='FX2',
                 param_names_map=FX_PARAM_NAMES,
-                get_type=lambda: self._fx2_type,
+                get_type=partial(getattr, self, '_fx2_type'),
                 get_param=self._get_fx2_param,
                 set_param=self._set_fx2_param,
             )
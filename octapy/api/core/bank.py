@@ -8,7 +8,7 @@ with constructor arguments or read from a bank file.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from ..._io import (
     BankFile,
@@ -69,26 +69,23 @@ class Bank:
         self._bank_file = BankFile()
         self._bank_file.flex_count = flex_count
 
-        # Initialize collections
-        self._parts: Dict[int, Part] = {}
-        self._patterns: Dict[int, Pattern] = {}
-
-        # Create default parts
-        for i in range(1, 5):
-            self._parts[i] = Part(part_num=i)
-
-        # Create default patterns
-        for i in range(1, 17):
-            self._patterns[i] = Pattern(pattern_num=i)
+        # Fixed-size collections, indexed by number - 1
+        self._parts: List[Part] = [Part(part_num=i) for i in range(1, 5)]
+        self._patterns: List[Pattern] = [Pattern(pattern_num=i) for i in range(1, 17)]
 
         # Apply provided parts/patterns
         if parts:
             for part in parts:
-                self._parts[part.part_num] = part
+                self._parts[part.part_num - 1] = part
 
         if patterns:
             for pattern in patterns:
-                self._patterns[pattern.pattern_num] = pattern
+                self._patterns[pattern.pattern_num - 1] = pattern
+
+        # Default objects are not yet in the blank buffer: sync them all
+        self._dirty_parts = set(range(1, 5))
+        self._dirty_patterns = set(range(1, 17))
+        self._byte_sum = None
 
     @classmethod
     def from_template(cls, bank_num: int = 1) -> "Bank":
@@ -105,23 +102,7 @@ class Bank:
         Returns:
             Bank instance with octapy defaults
         """
-        instance = cls.__new__(cls)
-        instance._bank_num = bank_num
-        instance._bank_file = BankFile.new(bank_num)
-        instance._parts = {}
-        instance._patterns = {}
-
-        # Load parts from template data
-        for i in range(1, 5):
-            part_offset = instance._bank_file.part_offset(i)
-            instance._parts[i] = Part.read_from_bank(i, instance._bank_file._data, part_offset)
-
-        # Load patterns from template data
-        for i in range(1, 17):
-            pattern_offset = instance._bank_file.pattern_offset(i)
-            instance._patterns[i] = Pattern.read_from_bank(i, instance._bank_file._data, pattern_offset)
-
-        return instance
+        return cls.from_bank_file(bank_num, BankFile.new(bank_num))
 
     @classmethod
     def from_file(cls, path: Path | str) -> "Bank":
@@ -135,23 +116,7 @@ class Bank:
             Bank instance
         """
         path = Path(path)
-        instance = cls.__new__(cls)
-        instance._bank_num = cls._parse_bank_num(path)
-        instance._bank_file = BankFile.from_file(path)
-        instance._parts = {}
-        instance._patterns = {}
-
-        # Load parts
-        for i in range(1, 5):
-            part_offset = instance._bank_file.part_offset(i)
-            instance._parts[i] = Part.read_from_bank(i, instance._bank_file._data, part_offset)
-
-        # Load patterns
-        for i in range(1, 17):
-            pattern_offset = instance._bank_file.pattern_offset(i)
-            instance._patterns[i] = Pattern.read_from_bank(i, instance._bank_file._data, pattern_offset)
-
-        return instance
+        return cls.from_bank_file(cls._parse_bank_num(path), BankFile.from_file(path))
 
     @classmethod
     def read(cls, bank_num: int, data: bytes) -> "Bank":
@@ -165,24 +130,43 @@ class Bank:
         Returns:
             Bank instance
         """
-        instance = cls.__new__(cls)
-        instance._bank_num = bank_num
-        instance._bank_file = BankFile.read(data)
-        instance._parts = {}
-        instance._patterns = {}
+        return cls.from_bank_file(bank_num, BankFile.read(data))
 
-        # Load parts
-        for i in range(1, 5):
-            part_offset = instance._bank_file.part_offset(i)
-            instance._parts[i] = Part.read_from_bank(i, instance._bank_file._data, part_offset)
+    @classmethod
+    def from_bank_file(cls, bank_num: int, bank_file: BankFile) -> "Bank":
+        """
+        Wrap a loaded BankFile, reading its parts and patterns.
 
-        # Load patterns
-        for i in range(1, 17):
-            pattern_offset = instance._bank_file.pattern_offset(i)
-            instance._patterns[i] = Pattern.read_from_bank(i, instance._bank_file._data, pattern_offset)
+        The Bank takes ownership of bank_file's buffer (no copy is made).
 
+        Args:
+            bank_num: Bank number (1-16)
+            bank_file: Low-level bank file to wrap
+
+        Returns:
+            Bank instance
+        """
+        instance = cls.__new__(cls)
+        instance._bank_num = bank_num
+        instance._bank_file = bank_file
+        instance._load_from_buffer()
         return instance
 
+    def _load_from_buffer(self):
+        """Read all parts and patterns from the bank buffer."""
+        data = self._bank_file._data
+        self._parts = [
+            Part.read_from_bank(i, data, self._bank_file.part_offset(i))
+            for i in range(1, 5)
+        ]
+        self._patterns = [
+            Pattern.read_from_bank(i, data, self._bank_file.pattern_offset(i))
+            for i in range(1, 17)
+        ]
+        self._dirty_parts = set()
+        self._dirty_patterns = set()
+        self._byte_sum = None
+
     @staticmethod
     def _parse_bank_num(path: Path) -> int:
         """Parse bank number from filename (e.g., bank01.work -> 1)."""
@@ -202,7 +186,7 @@ class Bank:
             path: Path to write (e.g., "bank01.work")
         """
         self._sync_to_buffer()
-        self._bank_file.to_file(Path(path))
+        self._bank_file.to_file(Path(path), self._byte_sum)
 
     def write(self) -> bytes:
         """
@@ -218,23 +202,42 @@ class Bank:
 
     def _sync_to_buffer(self):
         """Sync all parts and patterns back to the bank buffer."""
+        # Only parts/patterns that have been handed out (or replaced) can
+        # differ from the buffer. They stay dirty after a sync, since the
+        # caller may still hold a reference and keep editing.
+        bank_file = self._bank_file
+        data = bank_file._data
+
+        # Once the checksummed byte sum is known, keep it current by
+        # summing only the parts of each written region that changed,
+        # instead of the whole buffer.
+        tracking = self._byte_sum is not None
+
+        def write_region(obj, offset, size):
+            if not tracking:
+                obj.write_to_bank(data, offset)
+                return
+            old = bytes(data[offset:offset + size])
+            obj.write_to_bank(data, offset)
+            self._byte_sum += bank_file.byte_sum_delta(old, offset)
+
         # Sync parts to both unsaved and saved locations.
         # The OT bank file stores two copies of each Part: unsaved (working)
         # and saved (confirmed). Both must be written for the OT to load
         # the correct Part state (machine types, MIDI channels, FX, etc.).
-        for i in range(1, 5):
-            unsaved_offset = self._bank_file.part_offset(i)
-            saved_offset = self._bank_file.part_offset(i, saved=True)
-            self._parts[i].write_to_bank(self._bank_file._data, unsaved_offset)
-            self._parts[i].write_to_bank(self._bank_file._data, saved_offset)
+        for i in sorted(self._dirty_parts):
+            part = self._parts[i - 1]
+            write_region(part, bank_file.part_offset(i), PART_BLOCK_SIZE)
+            write_region(part, bank_file.part_offset(i, saved=True), PART_BLOCK_SIZE)
 
         # Sync patterns
-        for i in range(1, 17):
-            pattern_offset = self._bank_file.pattern_offset(i)
-            self._patterns[i].write_to_bank(self._bank_file._data, pattern_offset)
+        for i in sorted(self._dirty_patterns):
+            write_region(self._patterns[i - 1], bank_file.pattern_offset(i), PATTERN_SIZE)
 
         # Update checksum
-        self._bank_file.update_checksum()
+        if not tracking:
+            self._byte_sum = bank_file.byte_sum()
+        bank_file.update_checksum(self._byte_sum)
 
     def clone(self) -> "Bank":
         """Create a copy of this Bank with all parts and patterns cloned."""
@@ -245,15 +248,12 @@ class Bank:
         self._sync_to_buffer()
         instance._bank_file = BankFile.read(bytes(self._bank_file._data))
 
-        # Clone parts
-        instance._parts = {}
-        for i, part in self._parts.items():
-            instance._parts[i] = part.clone()
-
-        # Clone patterns
-        instance._patterns = {}
-        for i, pattern in self._patterns.items():
-            instance._patterns[i] = pattern.clone()
+        # Clone parts and patterns
+        instance._parts = [part.clone() for part in self._parts]
+        instance._patterns = [pattern.clone() for pattern in self._patterns]
+        instance._dirty_parts = set()
+        instance._dirty_patterns = set()
+        instance._byte_sum = self._byte_sum
 
         return instance
 
@@ -272,6 +272,7 @@ class Bank:
     @flex_count.setter
     def flex_count(self, value: int):
         self._bank_file.flex_count = value
+        self._byte_sum = None
 
     # === Part access ===
 
@@ -287,7 +288,8 @@ class Bank:
         """
         if part_num < 1 or part_num > 4:
             raise ValueError(f"Part number must be 1-4, got {part_num}")
-        return self._parts[part_num]
+        self._dirty_parts.add(part_num)
+        return self._parts[part_num - 1]
 
     def set_part(self, part_num: int, part: Part):
         """
@@ -300,7 +302,8 @@ class Bank:
         if part_num < 1 or part_num > 4:
             raise ValueError(f"Part number must be 1-4, got {part_num}")
         part._part_num = part_num
-        self._parts[part_num] = part
+        self._parts[part_num - 1] = part
+        self._dirty_parts.add(part_num)
 
     # === Pattern access ===
 
@@ -316,7 +319,8 @@ class Bank:
         """
         if pattern_num < 1 or pattern_num > 16:
             raise ValueError(f"Pattern number must be 1-16, got {pattern_num}")
-        return self._patterns[pattern_num]
+        self._dirty_patterns.add(pattern_num)
+        return self._patterns[pattern_num - 1]
 
     def set_pattern(self, pattern_num: int, pattern: Pattern):
         """
@@ -329,7 +333,8 @@ class Bank:
         if pattern_num < 1 or pattern_num > 16:
             raise ValueError(f"Pattern number must be 1-16, got {pattern_num}")
         pattern._pattern_num = pattern_num
-        self._patterns[pattern_num] = pattern
+        self._patterns[pattern_num - 1] = pattern
+        self._dirty_patterns.add(pattern_num)
 
     # === Serialization ===
 
@@ -347,8 +352,8 @@ class Bank:
         return {
             "bank": self._bank_num,
             "flex_count": self.flex_count,
-            "parts": [self._parts[n].to_dict(include_scenes=include_scenes) for n in range(1, 5)],
-            "patterns": [self._patterns[n].to_dict(include_steps=include_steps) for n in range(1, 17)],
+            "parts": [part.to_dict(include_scenes=include_scenes) for part in self._parts],
+            "patterns": [pattern.to_dict(include_steps=include_steps) for pattern in self._patterns],
         }
 
     @classmethod
@@ -362,12 +367,12 @@ class Bank:
         if "parts" in data:
             for part_data in data["parts"]:
                 part = Part.from_dict(part_data)
-                bank._parts[part.part_num] = part
+                bank._parts[part.part_num - 1] = part
 
         if "patterns" in data:
             for pattern_data in data["patterns"]:
                 pattern = Pattern.from_dict(pattern_data)
-                bank._patterns[pattern.pattern_num] = pattern
+                bank._patterns[pattern.pattern_num - 1] = pattern
 
         return bank
 
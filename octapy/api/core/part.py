@@ -128,10 +128,7 @@ class Part:
         instance._active_scene_b = bank_data[part_offset + PartOffset.ACTIVE_SCENE_B]
 
         # Read audio tracks
-        instance._audio_tracks = {}
-        for i in range(1, 9):
-            track = AudioPartTrack.read_from_part(i, bank_data, part_offset)
-            instance._audio_tracks[i] = track
+        instance._audio_tracks = AudioPartTrack.read_from_part_many(bank_data, part_offset)
 
         # Read MIDI tracks
         instance._midi_tracks = {}
@@ -164,8 +161,9 @@ class Part:
         bank_data[part_offset + PartOffset.ACTIVE_SCENE_B] = self._active_scene_b & 0x0F
 
         # Write audio tracks
-        for i in range(1, 9):
-            self._audio_tracks[i].write_to_part(bank_data, part_offset)
+        AudioPartTrack.write_to_part_many(
+            (self._audio_tracks[i] for i in range(1, 9)), bank_data, part_offset
+        )
 
         # Write MIDI tracks
         for i in range(1, 9):
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from ..._io import (
+    BankFile,
     ProjectFile,
     MarkersFile,
     SampleSlot,
@@ -182,11 +183,16 @@ class Project:
         else:
             instance._markers = MarkersFile.new()
 
-        # Load bank files
+        # Load bank files (reads overlapped across threads)
+        bank_paths = {}
         for i in range(1, 17):
             bank_path = path / f"bank{i:02d}.work"
             if bank_path.exists():
-                instance._banks[i] = Bank.from_file(bank_path)
+                bank_paths[i] = bank_path
+        bank_files = dict(zip(bank_paths, BankFile.load_all(bank_paths.values())))
+        for i in range(1, 17):
+            if i in bank_files:
+                instance._banks[i] = Bank.from_bank_file(i, bank_files[i])
             else:
                 instance._banks[i] = Bank(bank_num=i)
 
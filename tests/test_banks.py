@@ -20,6 +20,10 @@ class TestBankFileBasics:
         assert bank_file.check_header() is True
         assert bank_file.header == BANK_HEADER
 
+    def test_header_length(self):
+        """Test that the header constant is the 21 bytes check_header() reads."""
+        assert len(BANK_HEADER) == 21
+
     def test_version_valid(self, bank_file):
         """Test that template has correct version."""
         assert bank_file.check_version() is True
@@ -58,6 +62,44 @@ class TestBankFileRoundTrip:
         loaded = BankFile.from_file(path)
         assert loaded.verify_checksum() is True
 
+    def test_mmap_edit_in_place(self, bank_file, temp_dir):
+        """Test that edits through an mmap-backed bank reach the file."""
+        path = temp_dir / "bank01.work"
+        bank_file.to_file(path)
+
+        mapped = BankFile.from_file_mmap(path)
+        mapped.set_trigs(pattern=1, track=1, steps=[1, 5, 9, 13])
+        mapped.close()
+
+        loaded = BankFile.from_file(path)
+        assert loaded.get_trigs(pattern=1, track=1) == [1, 5, 9, 13]
+        assert loaded.verify_checksum() is True
+
+    def test_mmap_close_with_header_held(self, bank_file, temp_dir):
+        """Test that header and write() return owned bytes, not buffer views."""
+        path = temp_dir / "bank01.work"
+        bank_file.to_file(path)
+
+        mapped = BankFile.from_file_mmap(path)
+        header = mapped.header
+        data = mapped.write()
+        mapped.close()
+
+        assert isinstance(header, bytes) and header == BANK_HEADER
+        assert isinstance(data, bytes) and len(data) == BANK_FILE_SIZE
+
+    def test_write_into_file_object(self, bank_file):
+        """Test that write_into streams a checksummed buffer to a file object."""
+        import io
+
+        bank_file.set_trigs(pattern=1, track=1, steps=[1, 5])
+        buf = io.BytesIO()
+        bank_file.write_into(buf)
+
+        loaded = BankFile.read(buf.getvalue())
+        assert loaded._data == bank_file._data
+        assert loaded.verify_checksum() is True
+
 
 class TestBankFileTrigs:
     """Trigger pattern tests."""
@@ -76,6 +76,16 @@ class TestAudioRecorderSetupStandalone:
 
         assert data == OCTAPY_DEFAULT_RECORDER_SETUP
 
+    def test_write_into_matches_write(self):
+        """write_into() places the same bytes as write() at the given offset."""
+        recorder = AudioRecorderSetup(source=RecordingSource.INPUT_AB, rlen=32)
+        buf = bytearray(RECORDER_SETUP_SIZE + 8)
+        recorder.write_into(buf, 4)
+
+        assert buf[4:4 + RECORDER_SETUP_SIZE] == recorder.write()
+        assert buf[:4] == bytes(4)
+        assert buf[4 + RECORDER_SETUP_SIZE:] == bytes(4)
+
     def test_read_creates_equivalent_object(self):
         """read() from written data creates equivalent object."""
         original = AudioRecorderSetup(
@@ -961,6 +971,21 @@ class TestAudioPartTrackStandalone:
         assert a == b
         assert a != c
 
+    def test_equality_leaves_recorder_unbuilt(self):
+        """== treats an unbuilt recorder as the default without building it."""
+        a = AudioPartTrack(track_num=1)
+        b = AudioPartTrack(track_num=1)
+        assert a == b
+        assert a._recorder is None and b._recorder is None
+
+        b.recorder  # Built, but still default
+        assert a == b
+        assert a._recorder is None
+
+        b.recorder.source = RecordingSource.TRACK_2
+        assert a != b
+        assert a._recorder is None
+
     def test_to_dict(self):
         """to_dict() returns track properties."""
         track = AudioPartTrack(
@@ -999,6 +1024,27 @@ class TestAudioPartTrackStandalone:
         assert restored.fx1_type == original.fx1_type
         assert restored.recorder.source == original.recorder.source
 
+    def test_read_write_part_many_matches_single(self):
+        """Batched part read/write matches per-track read_from_part/write_to_part."""
+        tracks = [
+            AudioPartTrack(track_num=i, flex_slot=i, fx1_type=FX1Type.FILTER, main_volume=100 + i)
+            for i in range(1, 9)
+        ]
+        tracks[2].recorder.source = RecordingSource.TRACK_1
+        part_data = bytearray(8192)
+
+        AudioPartTrack.write_to_part_many(tracks, part_data)
+        single = bytearray(8192)
+        for track in tracks:
+            track.write_to_part(single)
+        assert part_data == single
+
+        restored = AudioPartTrack.read_from_part_many(part_data)
+        assert list(restored) == list(range(1, 9))
+        for i in range(1, 9):
+            assert restored[i] == AudioPartTrack.read_from_part(i, part_data)
+            assert restored[i] == tracks[i - 1]
+
     def test_fx_type_applies_defaults(self):
         """Setting FX type applies per-type default parameters."""
         track = AudioPartTrack()
@@ -1101,6 +1147,18 @@ class TestAudioPartTrackRecommendedDefaults:
         with pytest.raises(ValueError):
             track.configure_static(129)
 
+    def test_static_slot_rejects_out_of_range(self):
+        """static_slot raises rather than masking out-of-range values."""
+        track = AudioPartTrack(static_slot=5)
+
+        with pytest.raises(ValueError, match="static_slot must be 0-127"):
+            track.static_slot = 130
+        with pytest.raises(ValueError, match="static_slot must be 0-127"):
+            track.static_slot = -1
+        with pytest.raises(ValueError, match="static_slot must be 0-127"):
+            AudioPartTrack(static_slot=128)
+        assert track.static_slot == 5
+
     def test_default_constructor_uses_template_defaults(self):
         """Default constructor uses OT template defaults, not octapy."""
         track = AudioPartTrack(machine_type=MachineType.FLEX)
@@ -1352,6 +1410,44 @@ class TestFXAccessor:
 
         assert "no parameter 'invalid_param'" in str(exc.value)
 
+    def test_set_params(self):
+        """set_params() writes several params in one call."""
+        track = AudioPartTrack()
+        track.fx1_type = FX1Type.FILTER
+
+        track.fx1.set_params(base=10, width=20, decay=30)
+
+        assert track.fx1_param1 == 10
+        assert track.fx1_param2 == 20
+        assert track.fx1_param6 == 30
+
+    def test_set_params_invalid_name_raises(self):
+        """set_params() rejects names not valid for the current type."""
+        track = AudioPartTrack()
+        track.fx1_type = FX1Type.FILTER
+
+        with pytest.raises(AttributeError) as exc:
+            track.fx1.set_params(base=10, _data=None)
+
+        assert "no parameter '_data'" in str(exc.value)
+
+    def test_custom_names_map_mutation_not_stale(self):
+        """An accessor over a mutated names map sees the new names."""
+        from octapy.api.core._page import PageAccessor
+
+        values = {}
+        names_map = {'K': ('alpha', 'beta', '', '', '', '')}
+
+        def make():
+            return PageAccessor('TEST', names_map, lambda: 'K',
+                                values.get, values.__setitem__)
+
+        make().alpha = 5
+        names_map['K'] = ('gamma', '', '', '', '', '')
+        accessor = make()
+        assert accessor.get_param_names() == ['gamma']
+        assert accessor.gamma == 5
+
     def test_param_names_change_with_type(self):
         """Param names change when FX type changes."""
         track = AudioPartTrack()
@@ -2390,6 +2486,23 @@ class TestAudioSceneTrackDynamicAccessors:
         assert 'vol_ab' in names
         assert 'pitch' not in names
 
+    def test_src_accessor_read_after_type_change(self):
+        """Reads after a type change resolve against the new type's names."""
+        track = AudioSceneTrack(track_num=1, machine_type=MachineType.FLEX)
+        track.src.pitch = 72
+        assert track.src.pitch == 72
+        assert type(track.src).__name__ == (
+            "PageAccessor[pitch, start, length, rate, retrig, retrig_time]"
+        )
+
+        track._machine_type = MachineType.THRU
+        with pytest.raises(AttributeError, match="SRC page has no parameter 'pitch'"):
+            track.src.pitch
+        assert type(track.src).__name__ == "PageAccessor[in_ab, vol_ab, in_cd, vol_cd]"
+
+        track._machine_type = MachineType.PICKUP
+        assert track.src.pitch == 72
+
     def test_fx1_accessor_with_type(self):
         """FX1 accessor works when fx1_type is set."""
         track = AudioSceneTrack(track_num=1, fx1_type=FX1Type.FILTER)
@@ -3056,10 +3169,32 @@ class TestBankFromTemplate:
         assert bank.part(1) is not None
         assert bank.pattern(1) is not None
 
+    def test_from_bank_file(self):
+        """from_bank_file() wraps a low-level BankFile."""
+        from octapy._io import BankFile
+
+        bank_file = BankFile.new(bank_num=2)
+        bank_file.set_trigs(pattern=1, track=1, steps=[1, 9])
+        bank = Bank.from_bank_file(2, bank_file)
+
+        assert bank.bank_num == 2
+        assert bank.pattern(1).audio_track(1).active_steps == [1, 9]
+
 
 class TestBankSavedUnsavedSync:
     """Tests for Bank syncing Parts to both saved and unsaved slots."""
 
+    def test_template_write_saved_matches_unsaved(self):
+        """A fresh template bank writes identical saved and unsaved Parts."""
+        from octapy._io import BankFile, PART_BLOCK_SIZE
+
+        bank_file = BankFile.read(Bank.from_template(bank_num=1).write())
+        data = bank_file._data
+        for part_num in range(1, 5):
+            unsaved = bank_file.part_offset(part_num, saved=False)
+            saved = bank_file.part_offset(part_num, saved=True)
+            assert data[unsaved:unsaved + PART_BLOCK_SIZE] == data[saved:saved + PART_BLOCK_SIZE]
+
     def test_sync_writes_to_both_slots(self):
         """_sync_to_buffer() writes Parts to both unsaved and saved locations."""
         from octapy._io import (
@@ -3115,6 +3250,44 @@ class TestBankSavedUnsavedSync:
         assert unsaved_mt == int(MachineType.THRU)
         assert saved_mt == int(MachineType.THRU)
 
+    def test_held_reference_synced_after_write(self):
+        """Edits through a held Pattern reference reach every later sync."""
+        bank = Bank.from_template(bank_num=1)
+        pattern = bank.pattern(3)
+        bank.write()
+
+        pattern.audio_track(1).active_steps = [1, 5]
+        reread = Bank.read(1, bank.write())
+        assert reread.pattern(3).audio_track(1).active_steps == [1, 5]
+
+    def test_incremental_checksum_after_edits(self):
+        """Checksum stays valid across repeated syncs with edits between them."""
+        bank = Bank.from_template(bank_num=1)
+        bank.write()
+
+        bank.pattern(2).audio_track(4).active_steps = [2, 10]
+        bank.part(1).midi_track(1).channel = 7
+        bank.write()
+        assert bank._bank_file.verify_checksum() is True
+
+        bank.flex_count = 3
+        bank.write()
+        assert bank._bank_file.verify_checksum() is True
+
+    def test_to_file_uses_tracked_checksum(self, tmp_path):
+        """to_file() writes a valid checksum from the tracked byte sum."""
+        bank = Bank.from_template(bank_num=1)
+        bank.write()
+
+        bank.pattern(5).audio_track(2).active_steps = [3, 7]
+        path = tmp_path / "bank01.work"
+        bank.to_file(path)
+
+        assert bank._byte_sum == bank._bank_file.byte_sum()
+        reread = Bank.from_file(path)
+        assert reread._bank_file.verify_checksum() is True
+        assert reread.pattern(5).audio_track(2).active_steps == [3, 7]
+
 
 class TestBankRepr:
     """Tests for Bank string representation."""
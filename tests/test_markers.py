@@ -29,6 +29,10 @@ class TestMarkersFileBasics:
         assert markers_file.check_header() is True
         assert markers_file.header == MARKERS_HEADER
 
+    def test_header_length(self):
+        """Test that the header constant is the 21 bytes check_header() reads."""
+        assert len(MARKERS_HEADER) == 21
+
     def test_version_valid(self, markers_file):
         """Test that template has correct version."""
         assert markers_file.check_version() is True
@@ -4,7 +4,7 @@ Tests for ProjectFile.
 
 import pytest
 
-from octapy._io import ProjectFile, SampleSlot
+from octapy._io import ProjectFile, SampleSlot, read_template_file
 
 
 class TestProjectFileBasics:
@@ -22,6 +22,12 @@ class TestProjectFileBasics:
         """Test default OS version."""
         assert "1.40" in project_file.os_version
 
+    def test_new_matches_template(self):
+        """Test ProjectFile.new() serializes to the template project.work."""
+        template = read_template_file("project.work")
+        content = ProjectFile.new()._generate_content().encode('utf-8')
+        assert content.rstrip() == template.rstrip()
+
 
 class TestProjectFileTempo:
     """ProjectFile tempo tests."""
@@ -80,6 +86,16 @@ class TestProjectFileSampleSlots:
         for i, slot in enumerate(project_file.sample_slots):
             assert slot.slot_number == 129 + i
 
+    def test_slots_kept_in_slot_order(self, project_file):
+        """Test slots added out of order are stored sorted by slot number."""
+        project_file.add_sample_slot(3, "../AUDIO/hat.wav")
+        project_file.add_sample_slot(1, "../AUDIO/kick.wav")
+        project_file.add_recorder_slots()
+        project_file.add_sample_slot(2, "../AUDIO/snare.wav")
+
+        numbers = [slot.slot_number for slot in project_file.sample_slots]
+        assert numbers == [1, 2, 3] + list(range(129, 137))
+
     def test_slot_properties(self, project_file):
         """Test sample slot properties."""
         slot = project_file.add_sample_slot(
@@ -132,6 +148,30 @@ class TestProjectFileRoundTrip:
         assert loaded.tempo == 124.0
         assert loaded.tempo_x24 == 2976  # 124 * 24
 
+    def test_from_file_fields_subset(self, project_file, temp_dir):
+        """Test loading only the requested sections."""
+        path = temp_dir / "project.work"
+
+        project_file.tempo = 130.0
+        project_file.add_sample_slot(1, "../AUDIO/kick.wav")
+        project_file.to_file(path)
+
+        loaded = ProjectFile.from_file(path, fields={"settings"})
+        assert loaded.tempo == 130.0
+        assert loaded.sample_slots == []
+
+        loaded = ProjectFile.from_file(path, fields={"sample_slots"})
+        assert loaded.tempo == 120.0
+        assert len(loaded.sample_slots) == 1
+
+    def test_from_file_unknown_field(self, project_file, temp_dir):
+        """Test unknown field names are rejected."""
+        path = temp_dir / "project.work"
+        project_file.to_file(path)
+
+        with pytest.raises(ValueError):
+            ProjectFile.from_file(path, fields={"bogus"})
+
     def test_crlf_line_endings(self, project_file, temp_dir):
         """Test that output uses CRLF line endings."""
         path = temp_dir / "project.work"